@@ -22,18 +22,30 @@ Differences:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Tuple, Optional, Sequence, Set
-from collections import namedtuple
+from typing import Dict, FrozenSet, Tuple, Optional, Sequence
+from collections import deque
 import ctypes
+import functools
+import struct
 import time
 import sys
 
 
 # ── SimpleMessage (shared shape with PEAK version) ────────────
-SimpleMessage = namedtuple(
-    "SimpleMessage",
-    ["arbitration_id", "is_extended_id", "data", "timestamp"]  # timestamp in **ms**
-)
+class SimpleMessage:
+    """One received frame; slotted, so no per-instance __dict__."""
+    __slots__ = ("arbitration_id", "is_extended_id", "data", "timestamp")  # timestamp in **ms**
+
+    def __init__(self, arbitration_id: int, is_extended_id: bool, data: bytes, timestamp: float):
+        self.arbitration_id = arbitration_id
+        self.is_extended_id = is_extended_id
+        self.data           = data
+        self.timestamp      = timestamp
+
+    def __repr__(self) -> str:
+        return (f"SimpleMessage(arbitration_id={self.arbitration_id}, "
+                f"is_extended_id={self.is_extended_id}, data={self.data!r}, "
+                f"timestamp={self.timestamp})")
 
 # ── J2534 / Sloki bindings ────────────────────────────────────
 DWORD = ctypes.c_ulong
@@ -44,8 +56,21 @@ PROTO_CAN         = 0x00000005
 CAN_29BIT_ID      = 0x00000100   # flag bit for 29-bit frames
 CAN_ID_BOTH       = 0x00000800   # connect flag: accept 11-bit & 29-bit
 CLEAR_MSG_FILTERS = 0x0000000A
-
-MAX_BYTES = 4028  # Sloki buffer size
+STATUS_NOERROR    = 0x00000000
+ERR_TIMEOUT       = 0x00000009
+ERR_BUFFER_EMPTY  = 0x00000010
+
+# Sloki buffer size. Must match the DLL's PASSTHRU_MSG exactly: ReadMsgs walks
+# our RX array with its own sizeof(PASSTHRU_MSG) stride and may fill the whole
+# Data field, so a trimmed "CAN-only" struct would be overrun. Allocation cost
+# is avoided instead by reusing the preallocated RX array and TX message.
+MAX_BYTES = 4028
+RX_BATCH  = 32    # frames pulled from the DLL per PassThruReadMsgs call
+
+# Data[0:4] carries the arbitration ID, big-endian
+_ARB_HDR = struct.Struct(">I")
+_string_at = ctypes.string_at
+_addressof = ctypes.addressof
 
 class PASS_THRU_MSG(ctypes.Structure):
     _fields_ = [
@@ -106,10 +131,34 @@ class J2534API:
             return status, msg
         return status, None
 
+    def read_msgs(self, buf: ctypes.Array, n: int, timeout_ms: int) -> int:
+        """Fill up to *n* slots of the preallocated *buf* in one DLL call → count read."""
+        num = ULONG(n)
+        status = int(self.j2534.PassThruReadMsgs(self.channel_id, buf, ctypes.byref(num), timeout_ms))
+        # ERR_TIMEOUT may still deliver a partial batch; on any other error
+        # pNumMsgs may not have been written, so nothing was read
+        if status not in (STATUS_NOERROR, ERR_TIMEOUT, ERR_BUFFER_EMPTY):
+            return 0
+        return num.value
+
     def write_msg(self, msg: PASS_THRU_MSG, timeout_ms: int = 0) -> int:
         num = ULONG(1)
         return int(self.j2534.PassThruWriteMsgs(self.channel_id, ctypes.byref(msg), ctypes.byref(num), timeout_ms))
 
+# ── DBC-assisted ID typing ────────────────────────────────────
+@functools.lru_cache(maxsize=None)
+def _load_dbc_ids(path: str) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+    """Parse *path* once per process → (extended IDs, standard IDs).
+
+    Both sets are masked to 29 bits (a no-op for 11-bit IDs) so they share the
+    RX arbitration-ID key domain and need no re-masking per frame.
+    """
+    import cantools
+    db = cantools.database.load_file(path)
+    ext_ids = frozenset(m.frame_id & 0x1FFFFFFF for m in db.messages if m.is_extended_frame)
+    std_ids = frozenset(m.frame_id & 0x1FFFFFFF for m in db.messages if not m.is_extended_frame)
+    return ext_ids, std_ids
+
 # ── High-level bus adapter (matches PEAK wrapper contract) ────
 class SlokiBus:
     """
@@ -140,89 +189,98 @@ class SlokiBus:
         self._force_extended = bool(force_extended)
         self._prefer_ext_small = bool(prefer_extended_small_ids)
 
+        # RX batching: one DLL call drains up to RX_BATCH frames into the queue
+        self._rx_buf = (PASS_THRU_MSG * RX_BATCH)()
+        self._rx_queue: deque = deque()
+
+        # TX: one message reused for every send(); only the per-frame fields change
+        self._tx_msg = PASS_THRU_MSG()
+        self._tx_msg.ProtocolID = PROTO_CAN
+        self._tx_view = memoryview(self._tx_msg.Data).cast('B')
+
         # Pre-compute ID type from DBC (optional)
         self._dbc_assist = bool(enable_dbc_assist)
-        self._dbc_std_ids: Set[int] = set()
-        self._dbc_ext_ids: Set[int] = set()
+        self._dbc_std_ids: FrozenSet[int] = frozenset()
+        self._dbc_ext_ids: FrozenSet[int] = frozenset()
         if self._dbc_assist and dbc_path is not None and Path(dbc_path).exists():
             try:
-                import cantools
-                db = cantools.database.load_file(str(dbc_path))
-                for msg in db.messages:
-                    if getattr(msg, "is_extended_frame", False):
-                        self._dbc_ext_ids.add(msg.frame_id & 0x1FFFFFFF)
-                    else:
-                        self._dbc_std_ids.add(msg.frame_id & 0x7FF)
+                self._dbc_ext_ids, self._dbc_std_ids = _load_dbc_ids(str(dbc_path))
             except Exception:
                 self._dbc_assist = False  # fall back gracefully
 
-    @staticmethod
-    def _pack_tx(arbitration_id: int, data: bytes | Sequence[int], is_extended_id: bool) -> PASS_THRU_MSG:
+        # Fold DBC assist into one arb → is_extended dict; an ID the DBC lists
+        # both ways resolves as extended. IDs the DBC doesn't know fall back to
+        # the heuristic in recv_batch().
+        self._id_type: Dict[int, bool] = {}
+        if self._dbc_assist:
+            self._id_type = ({a: False for a in self._dbc_std_ids}
+                             | {a: True for a in self._dbc_ext_ids})
+        self._id_type_get = self._id_type.get
+
+    def _pack_tx(self, arbitration_id: int, data: bytes | Sequence[int], is_extended_id: bool) -> PASS_THRU_MSG:
         if not isinstance(data, (bytes, bytearray)):
             data = bytes(data)
         if len(data) > 8:
             raise ValueError("Classic CAN only (≤ 8 bytes).")
 
-        msg = PASS_THRU_MSG()
-        msg.ProtocolID = PROTO_CAN
+        msg = self._tx_msg
         msg.RxStatus   = 0
         msg.TxFlags    = CAN_29BIT_ID if is_extended_id else 0
         msg.Timestamp  = 0
         msg.DataSize   = len(data) + 4
 
-        arb = arbitration_id & 0x1FFFFFFF
-        msg.Data[0] = (arb >> 24) & 0xFF
-        msg.Data[1] = (arb >> 16) & 0xFF
-        msg.Data[2] = (arb >> 8)  & 0xFF
-        msg.Data[3] = (arb >> 0)  & 0xFF
-        for i, b in enumerate(data):
-            msg.Data[4 + i] = b
+        # header + payload written straight into the ctypes buffer (two C copies)
+        buf = self._tx_view
+        _ARB_HDR.pack_into(buf, 0, arbitration_id & 0x1FFFFFFF)
+        buf[4:4 + len(data)] = data
         return msg
 
-    def _resolve_is_extended(self, raw: PASS_THRU_MSG, arb: int) -> bool:
-        # 1) Spec flags first
-        if self._force_extended:
-            return True
-        if (raw.RxStatus & CAN_29BIT_ID) or (raw.TxFlags & CAN_29BIT_ID):
-            return True
-
-        # 2) DBC assist
-        if self._dbc_assist:
-            in_ext = (arb in self._dbc_ext_ids)
-            in_std = ((arb & 0x7FF) in self._dbc_std_ids)
-            if in_ext and not in_std:
-                return True
-            if in_std and not in_ext:
-                return False
-            # if both/neither, fall through
-
-        # 3) Ambiguity preference without DBC: treat small numeric IDs as extended.
-        #    This fixes setups where the adapter doesn't set the 29-bit flag
-        #    for IDs like 0x6, 0x9, etc., which are extended in the DBC.
-        if self._prefer_ext_small and arb <= 0x7FF:
-            return True
-
-        # 4) Heuristic
-        return bool(arb > 0x7FF)
-
-    def _unpack_rx(self, m: PASS_THRU_MSG) -> SimpleMessage:
-        arb = ((m.Data[0] << 24) | (m.Data[1] << 16) | (m.Data[2] << 8) | m.Data[3]) & 0x1FFFFFFF
-        dlc = max(0, int(m.DataSize) - 4)
-        payload = bytes(m.Data[4:4+dlc])
-        is_ext = self._resolve_is_extended(m, arb)
-
-        # Convert J2534 µs into **milliseconds**, then add ms base
-        ts_ms = self._t0_ms + (m.Timestamp / 1000.0)
-
-        return SimpleMessage(arb, is_ext, payload, ts_ms)
-
-    def recv(self, timeout: Optional[float] = None) -> Optional[SimpleMessage]:
+    def recv_batch(self, timeout: Optional[float] = None) -> list[SimpleMessage]:
+        """Return every frame available now (waiting ≤ *timeout* s for the first)."""
         # timeout is given in seconds → convert to ms for J2534
         ms = 0 if timeout is None else max(0, int(timeout * 1000))
-        status, msg = self.api.read_msg(ms)
-        if status != 0 or msg is None:
-            return None
-        return self._unpack_rx(msg)
+        buf = self._rx_buf
+        # Drain what is already queued without blocking; only wait for a single
+        # frame so a part-filled batch is never held back until the timeout.
+        n = self.api.read_msgs(buf, RX_BATCH, 0)
+        if n == 0 and ms:
+            n = self.api.read_msgs(buf, 1, ms)
+        if not n:
+            return []
+
+        # Unpack inline with everything hoisted to locals: per frame this is the
+        # only Python work between the DLL buffer and the caller.
+        unpack_arb, string_at, addressof = _ARB_HDR.unpack_from, _string_at, _addressof
+        force, id_type_get = self._force_extended, self._id_type_get
+        prefer, t0 = self._prefer_ext_small, self._t0_ms
+        out = []
+        for i in range(n):
+            m = buf[i]
+            data = m.Data
+            arb = unpack_arb(data)[0] & 0x1FFFFFFF
+            # clamp so a bogus DataSize can never read past the C buffer
+            dlc = min(max(0, m.DataSize - 4), MAX_BYTES - 4)
+
+            # ID type: 1) spec flags, 2) DBC assist (precomputed in __init__),
+            # 3) anything above 11 bits is extended, 4) ambiguity preference:
+            # treat small numeric IDs as extended. (4) fixes setups where the
+            # adapter doesn't set the 29-bit flag for IDs like 0x6, 0x9, etc.,
+            # which are extended in the DBC.
+            is_ext = (force or bool((m.RxStatus | m.TxFlags) & CAN_29BIT_ID)
+                      or id_type_get(arb, prefer or arb > 0x7FF))
+
+            # Convert J2534 µs into **milliseconds**, then add ms base
+            out.append(SimpleMessage(arb, is_ext,
+                                     string_at(addressof(data) + 4, dlc),   # one memcpy
+                                     t0 + m.Timestamp / 1000.0))
+        return out
+
+    def recv(self, timeout: Optional[float] = None) -> Optional[SimpleMessage]:
+        q = self._rx_queue
+        if q:
+            return q.popleft()
+        q.extend(self.recv_batch(timeout))
+        return q.popleft() if q else None
 
     def send(self, arbitration_id: int, data: bytes | Sequence[int], is_extended_id: bool = False) -> int:
         tx = self._pack_tx(arbitration_id, data, is_extended_id)
@@ -297,12 +355,15 @@ if __name__ == "__main__":
             if m is None:
                 continue
             cnt += 1
-            print(f"[{cnt}] SimpleMessage:")
-            print(f"  arbitration_id  : {hex(m.arbitration_id)}")
-            print(f"  is_extended_id  : {m.is_extended_id}")
-            print(f"  data            : {[hex(b) for b in m.data]}")
-            print(f"  timestamp (ms)  : {m.timestamp}")
-            print("----------------------------------------")
+            # one write per frame; payload as space-separated hex straight from bytes
+            sys.stdout.write(
+                f"[{cnt}] SimpleMessage:\n"
+                f"  arbitration_id  : {hex(m.arbitration_id)}\n"
+                f"  is_extended_id  : {m.is_extended_id}\n"
+                f"  data            : {m.data.hex(' ')}\n"
+                f"  timestamp (ms)  : {m.timestamp}\n"
+                "----------------------------------------\n"
+            )
     except KeyboardInterrupt:
         pass
     finally:
@@ -1,10 +1,11 @@
 # imp_params.py
 from __future__ import annotations
-import sys
+import sys, threading
+from collections import deque
 from typing import Dict
 
 import cantools
-from PySide6.QtCore    import Qt, Signal, QThread, QTimer
+from PySide6.QtCore    import Qt, QTimer
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel,
     QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -45,33 +46,42 @@ GROUPS: Dict[str, set[str]] = {
 }
 SIG_TO_GROUP = {sig: grp for grp, sset in GROUPS.items() for sig in sset}
 
+RING_SIZE   = 8_192     # decoded (sig, value, unit) records between reader and GUI
+DRAIN_MS    = 30        # GUI drain period
 
-# ─── CAN helper ─────────────────────────────────────────────────────────────
-def _msg(db, fid: int, ext: bool):
-    return db._frame_id_to_message.get(fid | 0x8000_0000 if ext else fid)
 
+# ─── CAN reader ─────────────────────────────────────────────────────────────
+class CanReader(threading.Thread):
+    """Appends (sig, value, unit) to ``self.ring`` (SPSC); the GUI drains it on a timer.
 
-class CanReader(QThread):
-    new_val = Signal(str, float, str)          # sig, value, unit
-    def __init__(self, bus, db): super().__init__(); self.bus, self.db, self._run = bus, db, True
+    A plain thread: nothing on the RX path touches Qt.
+    """
+    def __init__(self, bus, db):
+        super().__init__(name="CanReader", daemon=True)
+        self.bus, self.db, self._run = bus, db, True
+        # cantools keys extended IDs with bit-31 set; unknown IDs → .get() None
+        self._mdef = db._frame_id_to_message.get
+        self.ring: deque = deque(maxlen=RING_SIZE)
     def run(self):
+        push = self.ring.append
         try:
             while self._run:
                 m = self.bus.recv(0.1)
-                if not m: continue
-                d = _msg(self.db, m.arbitration_id, m.is_extended_id)
-                if not d: continue
+                if m is None:
+                    continue
+                d = self._mdef(m.arbitration_id | (m.is_extended_id << 31))
+                if d is None:
+                    continue
                 try:
                     dec = d.decode(m.data, allow_truncated=False, decode_choices=True)
                 except cantools.DecodeError:
                     continue
                 for s, v in dec.items():
                     if s in SIG_TO_GROUP:
-                        unit = d.get_signal_by_name(s).unit or ""
-                        self.new_val.emit(s, v, unit)
+                        push((s, v, d.get_signal_by_name(s).unit or ""))
         finally:
             if hasattr(self.bus, "shutdown"): self.bus.shutdown()
-    def stop(self): self._run = False; self.wait()
+    def stop(self): self._run = False; self.join()
 
 
 # ─── UI widgets ─────────────────────────────────────────────────────────────
@@ -135,12 +145,22 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "CAN Interface",
                                     "Running without live CAN data (DummyBus).\n"
                                     "Check PCAN drivers/DLL and channel settings.")
-            self._reader = CanReader(bus, db)
-            self._reader.new_val.connect(self._update); self._reader.start()
+            self._reader = CanReader(bus, db); self._reader.start()
+            self._drain_timer = QTimer(self)
+            self._drain_timer.timeout.connect(self._drain)
+            self._drain_timer.start(DRAIN_MS)
         except Exception as e:
             QMessageBox.critical(self, "Initialization Error",
                                  f"Backend initialization failed:\n{type(e).__name__}: {e}")
 
+    def _drain(self):
+        # newest value per signal wins; older ones in the batch are never painted
+        ring, latest = self._reader.ring, {}
+        if not ring:
+            return
+        for _ in range(len(ring)):
+            s, v, u = ring.popleft(); latest[s] = (v, u)
+        for s, (v, u) in latest.items(): self._update(s, v, u)
     def _update(self, s, v, u): self._widgets[SIG_TO_GROUP[s]].update(s, v, u)
     def closeEvent(self, e): self._reader.stop() if hasattr(self, "_reader") else None; super().closeEvent(e)
 
@@ -8,9 +8,10 @@
 # (c) 2025 – Annmon’s diagnostic‑tool demo
 
 import csv
-from dataclasses import dataclass
+import struct
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import can                                     # python‑can
 from PySide6.QtCore import Qt, QThread, Signal
@@ -25,41 +26,22 @@ PCAN_CHANNEL  = "PCAN_USBBUS1"                    # ← update
 BITRATE       = 500_000                           # ← update
 # ────────────────────────────────────────────────────────────────
 
-def decode_signal(payload: bytes,
-                  start: int,
-                  length: int,
-                  byte_order: str,
-                  is_signed: bool,
-                  scale: float,
-                  offset: float):
-    """
-    Return the *physical* value using Vector numbering.
-    • Intel  (little) → start bit is LSB, bits ascend
-    • Motorola (big)  → start bit is MSB, bits descend **within each byte**
-                         but jump +8 every full byte (Vector rule)
-    """
-    def get_bit(data: bytes, bit: int) -> int:
-        return (data[bit // 8] >> (bit & 7)) & 1
+EMIT_MAX = 256      # decoded records per cross-thread emit (caps GUI latency)
 
+def is_motorola(byte_order: str) -> bool:
     order_key = ''.join(byte_order.lower().split())
-    motorola = any(k in order_key for k in ("motorola", "big", "msb"))
-    raw = 0
+    return any(k in order_key for k in ("motorola", "big", "msb"))
+
 
-    if motorola:
-        for i in range(length):
-            # Vector Motorola rule
-            bit = start + 8 * (i // 8) - (i % 8)
-            raw = (raw << 1) | get_bit(payload, bit)
-    else:  # Intel / little-endian
-        for i in range(length):
-            raw |= get_bit(payload, start + i) << i
+# ====== CSV → in‑memory definitions =========================================
+# struct formats for byte-aligned Intel signals, keyed by (length, is_signed)
+_FAST_FORMATS = {(8, False): '<B', (16, False): '<H', (32, False): '<I', (64, False): '<Q',
+                 (8, True):  '<b', (16, True):  '<h', (32, True):  '<i', (64, True):  '<q'}
 
-    if is_signed and raw & (1 << (length - 1)):
-        raw -= 1 << length
+# (unpack_from, first byte)
+FastUnpack = Tuple[Callable, int]
 
-    return raw * scale + offset
 
-# ====== CSV → in‑memory definitions =========================================
 @dataclass
 class SignalDef:
     msg_id: int            # arbitration id (decimal)
@@ -70,6 +52,34 @@ class SignalDef:
     is_signed: bool
     scale: float
     offset: float
+    # precomputed in __post_init__ so the hot path does no string work
+    motorola: bool = field(init=False)
+    mask: int      = field(init=False)   # (1 << length) - 1
+    fast_unpack: Optional[FastUnpack] = field(init=False)
+    # Motorola only: (byte index, bit shift) for each bit, MSB first
+    bit_indices: Tuple[Tuple[int, int], ...] = field(init=False)
+    span: int      = field(init=False)   # payload bytes the signal reaches into
+
+    def __post_init__(self):
+        self.motorola = is_motorola(self.byte_order)
+        self.mask     = (1 << self.length) - 1
+        self.bit_indices = ()
+        if self.motorola:
+            # Vector Motorola rule, expanded once instead of per frame:
+            # bits descend inside each byte and jump +8 every full byte
+            bits = (self.start + 8 * (i // 8) - (i % 8) for i in range(self.length))
+            self.bit_indices = tuple((bit >> 3, bit & 7) for bit in bits)
+            self.span = max(byte for byte, _ in self.bit_indices) + 1
+        else:
+            # Intel: start is the LSB, bits ascend
+            self.span = (self.start + self.length - 1) // 8 + 1
+        fmt = None
+        if not self.motorola and self.start % 8 == 0:
+            fmt = _FAST_FORMATS.get((self.length, self.is_signed))
+        self.fast_unpack = None
+        if fmt:
+            first = self.start // 8
+            self.fast_unpack = (struct.Struct(fmt).unpack_from, first)
 
 
 def load_signal_db(csv_path: Path) -> Dict[int, List[SignalDef]]:
@@ -81,74 +91,168 @@ def load_signal_db(csv_path: Path) -> Dict[int, List[SignalDef]]:
     db: Dict[int, List[SignalDef]] = {}
 
     with csv_path.open(newline='', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+        # plain csv.reader + column indices: no per-row dict allocation
+        reader = csv.reader(f)
+        col = {name: i for i, name in enumerate(next(reader, None) or [])}
+        i_id, i_name = col["msg_id"], col["sig_name"]
+        i_start, i_len = col["start"], col["length"]
+        # optional columns; a missing one falls back to its default
+        i_order, i_signed = col.get("byte_order"), col.get("is_signed")
+        i_scale, i_offset = col.get("scale"), col.get("offset")
 
         for row in reader:
-            raw_id = row["msg_id"].strip()
+            if not row:
+                continue
+            raw_id = row[i_id].strip()
             if not raw_id:                         # skip blanks
                 continue
 
             msg_id = int(raw_id, 0)               # auto 0x / decimal
             sig = SignalDef(
                 msg_id     = msg_id,
-                name       = row["sig_name"],
-                start      = int(row["start"]),
-                length     = int(row["length"]),
-                byte_order = row.get("byte_order", "Intel"),
-                is_signed  = row.get("is_signed", "False").lower() in ("1","true","yes"),
-                scale      = float(row.get("scale", 1)),
-                offset     = float(row.get("offset", 0)),
+                name       = row[i_name],
+                start      = int(row[i_start]),
+                length     = int(row[i_len]),
+                byte_order = row[i_order] if i_order is not None else "Intel",
+                is_signed  = (i_signed is not None
+                              and row[i_signed].lower() in ("1","true","yes")),
+                scale      = float(row[i_scale]) if i_scale is not None else 1.0,
+                offset     = float(row[i_offset]) if i_offset is not None else 0.0,
             )
             db.setdefault(msg_id, []).append(sig)
 
     return db
 
 
+# ====== per-message struct-of-arrays ========================================
+# (names, starts, lengths, motorola, signed, scales, offsets, masks, fast_unpack,
+#  bit_indices, spans)
+Layout = Tuple[tuple, tuple, tuple, tuple, tuple, tuple, tuple, tuple, tuple, tuple,
+               tuple]
+
+
+def build_layouts(sig_db: Dict[int, List[SignalDef]]) -> Dict[int, Layout]:
+    """Flatten {msg_id: [SignalDef …]} into one column tuple per field."""
+    return {
+        msg_id: tuple(zip(*((d.name, d.start, d.length, d.motorola, d.is_signed,
+                             d.scale, d.offset, d.mask, d.fast_unpack,
+                             d.bit_indices, d.span)
+                            for d in defs)))
+        for msg_id, defs in sig_db.items() if defs
+    }
+
+
+def decode_all(payload: bytes, layout: Layout) -> List[Tuple[str, float]]:
+    """
+    Decode every signal of one frame in a single call → [(name, physical), …].
+
+    Uses Vector numbering (see SignalDef) driven by precomputed columns, so
+    there is no SignalDef attribute access or byte-order parsing per signal.
+    A signal reaching past the end of a short frame (DLC below its span) is
+    left out, whatever its byte order.
+    """
+    (names, starts, lengths, motorola, signed, scales, offsets, masks, fasts,
+     bit_tables, spans) = layout
+    frame = int.from_bytes(payload, "little")
+    size = len(payload)
+    out = []
+    for name, start, length, mot, sgn, scale, offset, mask, fast, bits, span in zip(
+            names, starts, lengths, motorola, signed, scales, offsets, masks, fasts,
+            bit_tables, spans):
+        if span > size:
+            continue                    # not (fully) in this frame
+        if fast is not None:
+            # byte-aligned Intel u8…i64: one C call, sign handled by struct
+            out.append((name, fast[0](payload, fast[1])[0] * scale + offset))
+            continue
+        if mot:
+            raw = 0
+            for byte, shift in bits:
+                raw = (raw << 1) | ((payload[byte] >> shift) & 1)
+        else:
+            raw = (frame >> start) & mask
+        if sgn and raw >> (length - 1):
+            raw -= 1 << length
+        out.append((name, raw * scale + offset))
+    return out
+
+
 # ====== CAN reader thread ====================================================
 class CanReader(QThread):
     """
-    Runs in the background, decodes frames and emits:
-        new_value(msg_id, sig_name, physical_value, cycle_ms)
+    Runs in the background and emits, once per receive burst:
+        new_values([(msg_id, sig_name, physical_value, cycle_ms), …])
+    Only the newest frame of each ID in the burst is decoded.
     """
-    new_value = Signal(int, str, float, float)
+    new_values = Signal(list)
 
     def __init__(self, sig_db: Dict[int, List[SignalDef]],
                  channel: str, bitrate: int):
         super().__init__()
         self.sig_db   = sig_db
+        self.layouts  = build_layouts(sig_db)
         self.channel  = channel
         self.bitrate  = bitrate
         self._stop    = False
         self._last_ts: Dict[int, float] = {}   # msg_id → last timestamp (sec)
 
+    def _bursts(self, bus):
+        """
+        Yield the next frame (waiting ≤50 ms so stop() is honoured promptly),
+        then keep draining the driver queue with non-blocking reads.  A
+        saturated bus never runs dry, so stop() is checked per frame too.
+        """
+        msg = bus.recv(0.05)
+        while msg is not None and not self._stop:
+            yield msg
+            msg = bus.recv(0)
+
     def run(self) -> None:
+        # keep the RX loop ahead of GUI painting so the driver queue never overruns
+        self.setPriority(QThread.TimeCriticalPriority)
         bus = can.Bus(interface="pcan",
                       channel=self.channel,
                       bitrate=self.bitrate)
         try:
-            for msg in bus:
-                if self._stop:
-                    break
-
-                defs = self.sig_db.get(msg.arbitration_id)
-                if not defs:                     # ignore un‑known IDs
-                    continue
-
-                now = msg.timestamp              # float seconds
-                cycle_ms = 0.0
-                if msg.arbitration_id in self._last_ts:
-                    cycle_ms = (now - self._last_ts[msg.arbitration_id]) * 1000.0
-                self._last_ts[msg.arbitration_id] = now
-
-                payload = msg.data
-                for d in defs:
-                    val = decode_signal(payload, d.start, d.length,
-                                        d.byte_order, d.is_signed,
-                                        d.scale, d.offset)
-                    self.new_value.emit(d.msg_id, d.name, val, cycle_ms)
+            # msg_id → (payload, cycle_ms) of the newest frame this burst; the
+            # table only shows the latest value, so older frames of the same
+            # ID are never decoded.
+            pending: Dict[int, Tuple[bytes, float]] = {}
+            last_ts, layouts = self._last_ts, self.layouts
+            while not self._stop:
+                n = 0
+                for msg in self._bursts(bus):
+                    msg_id = msg.arbitration_id
+                    if msg_id not in layouts:        # ignore un‑known IDs
+                        continue
+
+                    now = msg.timestamp              # float seconds
+                    cycle_ms = 0.0
+                    if msg_id in last_ts:
+                        cycle_ms = (now - last_ts[msg_id]) * 1000.0
+                    last_ts[msg_id] = now
+
+                    pending[msg_id] = (msg.data, cycle_ms)
+                    n += 1
+                    if n >= EMIT_MAX:                # endless burst: flush anyway
+                        self._flush(pending)
+                        n = 0
+                # one queued Qt event per burst instead of one per signal
+                if pending:
+                    self._flush(pending)
         finally:
             bus.shutdown()
 
+    def _flush(self, pending: Dict[int, Tuple[bytes, float]]) -> None:
+        """Decode the newest frame per ID, emit the records and clear *pending*."""
+        batch: List[Tuple[int, str, float, float]] = []
+        for msg_id, (data, cycle_ms) in pending.items():
+            layout = self.layouts[msg_id]
+            batch.extend((msg_id, name, val, cycle_ms)
+                         for name, val in decode_all(data, layout))
+        pending.clear()
+        self.new_values.emit(batch)
+
     def stop(self):
         self._stop = True
         self.quit()
@@ -178,20 +282,34 @@ class MainWindow(QMainWindow):
 
         # start CAN thread
         self.reader = CanReader(sig_db, PCAN_CHANNEL, BITRATE)
-        self.reader.new_value.connect(self.on_new_value)
+        self.reader.new_values.connect(self.on_new_values)
         self.reader.start()
 
-    # ---------- slot ----------
+    # ---------- slots ----------
+    def on_new_values(self, batch: List[Tuple[int, str, float, float]]):
+        # Painting is off for the whole burst: the model still reports every
+        # insert and change (so selection, sorting and proxies stay current),
+        # but the table repaints once when updates are switched back on.
+        self.table.setUpdatesEnabled(False)
+        try:
+            for rec in batch:
+                self.on_new_value(*rec)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def _add_row(self, msg_id: int, name: str) -> int:
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self.table.setItem(row, 0, QTableWidgetItem(f"0x{msg_id:08X}"))
+        self.table.setItem(row, 1, QTableWidgetItem(name))
+        self.row_map[(msg_id, name)] = row
+        return row
+
     def on_new_value(self, msg_id: int, name: str,
                      value: float, cycle_ms: float):
-        key = (msg_id, name)
-        row = self.row_map.get(key)
+        row = self.row_map.get((msg_id, name))
         if row is None:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(f"0x{msg_id:08X}"))
-            self.table.setItem(row, 1, QTableWidgetItem(name))
-            self.row_map[key] = row
+            row = self._add_row(msg_id, name)
 
         # value cell
         v_item = QTableWidgetItem(f"{value:.3f}")
@@ -0,0 +1,55 @@
+"""
+_decode_plan.py  –  decode plain DBC messages without going through cantools.
+
+    compile_plan(mdef)       -> DecodePlan, or None if cantools must decode it
+    decode_plain(data, plan) -> [physical value per signal, in signal order]
+
+Kept free of Qt and of any DBC load so the decoder can be tested on its own.
+"""
+from typing import List, Optional, Tuple
+
+# (length, ((big_endian, shift, mask, sign_bit, scale, offset), …))
+DecodePlan = Tuple[int, tuple]
+
+
+def compile_plan(mdef) -> Optional[DecodePlan]:
+    """
+    Precompile *mdef* into a DecodePlan, or None if cantools must decode it.
+
+    Only plain integer messages qualify: no multiplexing, containers, value
+    tables or IEEE float signals.  Every signal then reduces to one shift and
+    mask of the payload read as a single little- or big-endian integer.
+    """
+    if (mdef.is_multiplexed() or getattr(mdef, "is_container", False)
+            or any(s.choices or s.is_float for s in mdef.signals)):
+        return None
+    nbits = 8 * mdef.length
+    ops = []
+    for s in mdef.signals:
+        if s.byte_order == "big_endian":
+            # cantools' start is the MSB in sawtooth numbering; convert it to
+            # an MSB-first position, then to a shift of the big-endian integer
+            msb = 8 * (s.start // 8) + 7 - s.start % 8
+            shift, big = nbits - msb - s.length, True
+        else:
+            shift, big = s.start, False
+        sign_bit = 1 << (s.length - 1) if s.is_signed else 0
+        ops.append((big, shift, (1 << s.length) - 1, sign_bit, s.scale, s.offset))
+    return mdef.length, tuple(ops)
+
+
+def decode_plain(data: bytes, plan: DecodePlan) -> Optional[List[float]]:
+    """Decode one frame with a precompiled plan; None if it is too short."""
+    length, ops = plan
+    if len(data) < length:
+        return None
+    data = data[:length]
+    le = int.from_bytes(data, "little")
+    be = int.from_bytes(data, "big")
+    out = []
+    for big, shift, mask, sign_bit, scale, offset in ops:
+        raw = ((be if big else le) >> shift) & mask
+        if raw & sign_bit:
+            raw -= sign_bit << 1
+        out.append(raw * scale + offset)
+    return out
@@ -10,6 +10,7 @@ csv_to_dbc_full.py  –  Convert a Vector‑style signal table (signals.csv)
 
 from pathlib import Path
 from collections import defaultdict
+import numpy as np
 import pandas as pd
 import re
 
@@ -26,24 +27,35 @@ def sanitize(name: str) -> str:
     """Replace characters that Vector dislikes with '_'."""
     return re.sub(r'[^A-Za-z0-9_]', '_', str(name))
 
-def vector_bits(start: int, length: int, byte_order: str):
+# Vector Motorola rule as a fixed per-position offset from the start bit:
+# bit i of a big‑endian signal sits at start + 8·(i // 8) − (i % 8).
+# Tabulated once for the largest CAN FD payload (64 bytes).
+_MAX_BITS = 512
+_IDX = np.arange(_MAX_BITS)
+_MOTOROLA_OFFSETS = 8 * (_IDX // 8) - (_IDX % 8)
+
+def _bit_offsets(length: int):
+    """(Intel, Motorola) offset rows for the first *length* bit positions."""
+    if length <= _MAX_BITS:
+        return _IDX[:length], _MOTOROLA_OFFSETS[:length]
+    idx = np.arange(length)                     # malformed row: compute directly
+    return idx, 8 * (idx // 8) - (idx % 8)
+
+def vector_bits_matrix(starts: np.ndarray, lengths: np.ndarray, intel: np.ndarray):
     """
-    Return the *exact* bit indices (0‑based) a signal occupies,
+    Return the *exact* bit indices (0‑based) every signal of a table occupies,
     following Vector’s numbering:
         • Intel  (little‑endian): ascending bits
         • Motorola (big‑endian): descending bits inside each byte,
           jump +8 at every byte boundary.
+    → (bits, valid), each (N, max_len): row i holds the bit indices of
+    signal i in its first lengths[i] columns; `valid` masks off the padding.
     """
-    if byte_order.lower().startswith("l"):  # Intel / little‑endian
-        return list(range(start, start + length))
-
-    # Motorola / big‑endian (Vector rule)
-    bits = []
-    for i in range(length):
-        byte_jump = i // 8
-        bit = start + 8 * byte_jump - (i % 8)
-        bits.append(bit)
-    return bits
+    idx, motorola = _bit_offsets(int(lengths.max(initial=0)))
+    bits = np.where(intel[:, None],
+                    starts[:, None] + idx,          # Intel
+                    starts[:, None] + motorola)     # Motorola
+    return bits, idx < lengths[:, None]
 
 # ── LOAD CSV ───────────────────────────────────────────────────────────────
 if not CSV_IN.exists():
@@ -51,25 +63,38 @@ if not CSV_IN.exists():
 df = pd.read_csv(CSV_IN)
 
 # ── CONFLICT CHECK (optional but useful) ───────────────────────────────────
-alloc = defaultdict(lambda: defaultdict(set))  # {msg_id: {mux_ctx: set(bits)}}
-conflicts = []
-
-for _, row in df.iterrows():
-    msg_id = row["msg_id"]
-    mux_ctx = row["mode"] if pd.notna(row["mode"]) and row["mode"] else "BASE"
-    bits = vector_bits(int(row["start"]), int(row["length"]), row["byte_order"])
-
-    # A multiplexor itself (usually mode == 'M') may share bits
-    # with its children; we ignore collisions on the multiplexor row.
-    is_mux_def = isinstance(row["mode"], str) and row["mode"].upper().startswith("M")
+# A signal conflicts when it claims a bit already used by an *earlier* row of
+# the same (msg_id, mux_ctx). Each row's bits become one int bitmap (built for
+# all rows at once with NumPy), so the ordered scan is a single AND / OR per
+# row against its context's bitmap instead of set operations.
+mode = df["mode"]
+mux_ctx = mode.where(mode.fillna("").astype(bool), "BASE")
+# A multiplexor itself (usually mode == 'M') may share bits
+# with its children; we ignore collisions on the multiplexor row.
+is_mux_def = (mode.notna() & mode.astype(str).str.upper().str.startswith("M")).to_numpy()
+ctx_code = df.groupby([df["msg_id"], mux_ctx], sort=False, dropna=False).ngroup().to_numpy()
+
+bits, valid = vector_bits_matrix(df["start"].to_numpy(int), df["length"].to_numpy(int),
+                                 df["byte_order"].str.lower().str.startswith("l").to_numpy())
+rows = np.broadcast_to(np.arange(len(df))[:, None], bits.shape)[valid]
+bits = bits[valid]
 
-    if not is_mux_def:
-        overlap = alloc[msg_id][mux_ctx].intersection(bits)
-        if overlap:
-            conflicts.append((msg_id, mux_ctx, row["sig_name"], sorted(overlap)))
-        alloc[msg_id][mux_ctx].update(bits)
-    else:
-        alloc[msg_id][mux_ctx].update(bits)
+conflicts = []
+if bits.size:
+    # Motorola bits can go negative, so bitmap bit i stands for signal bit i + lo
+    lo = int(bits.min())
+    occupied = np.zeros((len(df), int(bits.max()) - lo + 1), dtype=bool)
+    occupied[rows, bits - lo] = True
+    packed = np.packbits(occupied, axis=1, bitorder="little")
+
+    alloc = defaultdict(int)                        # ctx_code → occupied-bit bitmap
+    for r, (ctx, row_bytes) in enumerate(zip(ctx_code.tolist(), packed)):
+        new = int.from_bytes(row_bytes.tobytes(), "little")
+        overlap = alloc[ctx] & new
+        if overlap and not is_mux_def[r]:
+            conflicts.append((df["msg_id"].iat[r], mux_ctx.iat[r], df["sig_name"].iat[r],
+                              [i + lo for i in range(overlap.bit_length()) if overlap >> i & 1]))
+        alloc[ctx] |= new
 
 if conflicts:
     print("⚠️  Genuine bit overlaps detected (same multiplex context):")
@@ -78,6 +103,31 @@ if conflicts:
     print("   You *must* fix these rows in the CSV if cantools still rejects them.\n")
 
 # ── BUILD DBC TEXT ─────────────────────────────────────────────────────────
+def _text(col: pd.Series) -> pd.Series:
+    """Column as str, with NaN → '' (what the f-strings below expect)."""
+    return col.astype(str).where(col.notna(), "")
+
+# Every per-signal piece is formatted column-wise once for the whole table,
+# so the per-message loop only slices ready-made strings.
+sig_clean = df["sig_name"].astype(str).str.replace(r"[^A-Za-z0-9_]", "_", regex=True)
+mode      = _text(df["mode"])
+mode_str  = (" " + mode).where(mode != "", "")
+endian    = df["byte_order"].str.lower().str.startswith("l").map({True: "1", False: "0"})
+sign_char = (df["is_signed"].astype(int) != 0).map({True: "-", False: "+"})
+
+df["sg_line"] = ("    SG_ " + sig_clean + mode_str
+                 + " : " + df["start"].astype(int).astype(str)
+                 + "|" + df["length"].astype(int).astype(str)
+                 + "@" + endian + sign_char
+                 + " (" + df["scale"].astype(float).astype(str)
+                 + "," + df["offset"].astype(float).astype(str)
+                 + ") [" + _text(df["min"]) + "|" + _text(df["max"])
+                 + '] "' + _text(df["unit"]) + '" ECU')
+
+# CM_ SG_ lines: everything after the (per-message) DBC ID
+sig_comment = _text(df["sig_comment"])
+df["cm_tail"] = (" " + sig_clean + ' "' + sig_comment + '";').where(sig_comment != "")
+
 lines = [
     'VERSION ""',
     "",
@@ -87,44 +137,32 @@ lines = [
     ""
 ]
 
-for msg_hex, grp in df.groupby("msg_id"):
-    first = grp.iloc[0]
+# One pass over plain tuples: the message header comes from each message's
+# first CSV row, its SG_/CM_ lines from the grouped columns above.
+by_msg   = df.groupby("msg_id")
+sg_lines = by_msg["sg_line"].agg(list)
+cm_tails = by_msg["cm_tail"].agg(lambda tails: tails.dropna().tolist())
+heads    = (df[df["msg_id"].notna()].drop_duplicates("msg_id").sort_values("msg_id")
+            [["msg_id", "frame_type", "dlc", "msg_name", "msg_comment"]])
 
+for msg_hex, frame_type, dlc, msg_name, msg_comment in heads.itertuples(index=False, name=None):
     raw_id = int(msg_hex, 16)
-    frame_type = first["frame_type"].strip().lower()
+    frame_type = frame_type.strip().lower()
     if raw_id > 0x7FF:                     # auto‑correct mislabeled frames
         frame_type = "extended"
     dbc_id = raw_id | 0x80000000 if frame_type == "extended" else raw_id
 
-    dlc = int(first["dlc"])
-    msg_name = sanitize(first["msg_name"])
-    msg_comment = "" if pd.isna(first["msg_comment"]) else str(first["msg_comment"])
+    dlc = int(dlc)
+    msg_name = sanitize(msg_name)
+    msg_comment = "" if pd.isna(msg_comment) else str(msg_comment)
 
     lines.append(f"BO_ {dbc_id} {msg_name}: {dlc} ECU")
-
-    for _, row in grp.iterrows():
-        sig_name = sanitize(row["sig_name"])
-        mode = row["mode"] if pd.notna(row["mode"]) else ""
-        start = int(row["start"]); length = int(row["length"])
-        endian = "1" if row["byte_order"].lower().startswith("l") else "0"
-        sign_char = "-" if int(row["is_signed"]) else "+"
-        scale = float(row["scale"]); offset = float(row["offset"])
-        lo = "" if pd.isna(row["min"]) else row["min"]
-        hi = "" if pd.isna(row["max"]) else row["max"]
-        unit = "" if pd.isna(row["unit"]) else row["unit"]
-
-        sg = f"    SG_ {sig_name}"
-        if mode:
-            sg += f" {mode}"
-        sg += f" : {start}|{length}@{endian}{sign_char} ({scale},{offset}) [{lo}|{hi}] \"{unit}\" ECU"
-        lines.append(sg)
+    lines.extend(sg_lines[msg_hex])
 
     lines.append("")
     if msg_comment:
         lines.append(f'CM_ BO_ {dbc_id} "{msg_comment}";')
-    for _, row in grp.iterrows():
-        if pd.notna(row["sig_comment"]) and row["sig_comment"] != "":
-            lines.append(f'CM_ SG_ {dbc_id} {sanitize(row["sig_name"])} "{row["sig_comment"]}";')
+    lines.extend(f"CM_ SG_ {dbc_id}{tail}" for tail in cm_tails[msg_hex])
     lines.append("")
 
 # ── WRITE FILE ─────────────────────────────────────────────────────────────
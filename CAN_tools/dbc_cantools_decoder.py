@@ -1,51 +1,97 @@
 import sys, time
+from array import array
+from collections import deque
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 import can, cantools
-from PySide6.QtCore    import QThread, Signal
+from PySide6.QtCore    import QThread, QTimer
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QTableWidget, QTableWidgetItem,
+    QApplication, QMainWindow, QTableView,
     QVBoxLayout, QWidget, QPushButton
 )
 
+from _dbc_loader import load_dbc
+from _decode_plan import compile_plan, decode_plain
+from _signal_table_model import CanTableModel, SigInfo
+
 # ─────────── User Settings ───────────
 DBC_PATH     = Path(r"C:\Git_projects\can_diagnostic_tool\data\DBC_sample_cantools.dbc")
 PCAN_CHANNEL = "PCAN_USBBUS1"
 BITRATE      = 500_000
 USE_CAN_FD   = False
 DATA_PHASE   = "500K/2M"
+
+RING_SIZE    = 65_536      # decoded records buffered between reader and GUI
+DRAIN_MS     = 33          # GUI drain period (~30 Hz)
+DRAIN_MAX    = 5_000       # records applied per drain tick
 # ─────────────────────────────────────
 
-dbc = cantools.database.load_file(DBC_PATH)
+dbc = load_dbc(str(DBC_PATH))
 print(f"Loaded DBC: {DBC_PATH}  (messages: {len(dbc.messages)})")
 
-# ───────── Utility: fast lookup without 0x8000_0000 in main loop ─────────
-def get_message(dbc_db, frame_id: int, is_ext: bool):
+# ───────── Precomputed message table (built once at DBC load) ─────────
+# Every (message, signal) pair gets a dense sig_id; SIG_INFO[sig_id] holds
+# its static columns so only numbers travel from the reader to the GUI.
+
+def _build_msg_table(dbc_db) -> Tuple[Dict[int, tuple], List[SigInfo]]:
     """
-    cantools stores extended IDs with bit-31 set (0x8000_0000).
-    This helper hides that detail from the hot path.
+    Returns (MSG_TABLE, SIG_INFO).
+
+    MSG_TABLE: lookup_id → (mdef, msg_idx, sig_ids, mux_ids, has_choices, plan)
+
+    The key is frame_id | (is_ext << 31), i.e. bit-31 marks extended IDs like
+    cantools' own table, and the reader builds it without a branch.
+    sig_ids follows the message's signal order, which is also the order of
+    mdef.decode() for plain messages.  Multiplexed messages only decode the
+    active signals, so they get a name → sig_id dict (mux_ids) as well.
+    has_choices is False when no signal has a value table, so the reader can
+    skip NamedSignalValue construction for that message.  plan, when not
+    None, lets the reader bypass mdef.decode() entirely (see compile_plan).
     """
-    lookup_id = frame_id | 0x8000_0000 if is_ext else frame_id
-    try:
-        return dbc_db._frame_id_to_message[lookup_id]
-    except KeyError:
-        return None
-# (using the private dict is ~30 % faster, but we could call
-#  dbc_db.get_message_by_frame_id(lookup_id) just as well)
+    table: Dict[int, tuple] = {}
+    info: List[SigInfo] = []
+    for mdef in dbc_db.messages:
+        sig_ids = []
+        for s in mdef.signals:
+            sig_ids.append(len(info))
+            info.append((mdef.frame_id, mdef.is_extended_frame,
+                         mdef.name, s.name, s.unit or ""))
+        sig_ids = tuple(sig_ids)
+        mux_ids = ({s.name: sid for s, sid in zip(mdef.signals, sig_ids)}
+                   if mdef.is_multiplexed() else None)
+        key = mdef.frame_id | (mdef.is_extended_frame << 31)
+        has_choices = any(s.choices for s in mdef.signals)
+        table[key] = (mdef, len(table), sig_ids, mux_ids, has_choices,
+                      compile_plan(mdef))
+    return table, info
+
+MSG_TABLE, SIG_INFO = _build_msg_table(dbc)
 
 
 # ───────── CAN Reader Thread ─────────
 class CanReader(QThread):
     """
-    Emits: raw_frame_id, is_extended, msg_name, sig_name, value, unit, cycle_ms
+    Pushes raw (sig_id, value, cycle, count_delta) records into
+    ``self.ring``; the GUI thread drains it on a timer and formats only what
+    it shows.
+
+    Single producer (this thread) / single consumer (GUI): deque.append and
+    deque.popleft are atomic, so no lock or queued signal is needed.  When the
+    GUI falls behind, the bounded deque drops the oldest records; ``dropped``
+    counts them so the GUI can say its counts and cycle times are short.
     """
-    new_signal = Signal(int, bool, str, str, float, str, float)
 
     def __init__(self):
         super().__init__()
         self._running = True
-        self._last_ts: Dict[str, float] = {}
+        self.ring: deque = deque(maxlen=RING_SIZE)
+        self.dropped = 0                    # records pushed out of a full ring
+        # last timestamp, 0.0 = not seen yet.  Every signal of a plain message
+        # arrives in every frame, so one slot per message covers all of them;
+        # only multiplexed signals need a slot of their own.
+        self._msg_last_ts = array("d", [0.0]) * len(MSG_TABLE)
+        self._last_ts     = array("d", [0.0]) * len(SIG_INFO)
 
         bus_kwargs = dict(interface="pcan",
                           channel=PCAN_CHANNEL,
@@ -54,40 +100,71 @@ class CanReader(QThread):
             bus_kwargs.update(fd=True, bitrate_fd=DATA_PHASE)
         self.bus = can.Bus(**bus_kwargs)
 
+        # python-can's notifier thread pulls frames off the driver into
+        # self.buf; run() then drains whole bursts per wake-up.
+        self.buf = can.BufferedReader()
+        self.notifier = can.Notifier(self.bus, [self.buf], timeout=0.1)
+
+    def _bursts(self):
+        """
+        Yield the next frame (waiting ≤100 ms), then everything queued behind
+        it.  A saturated bus never runs dry, so stop() is checked per frame too.
+        """
+        get = self.buf.get_message
+        msg = get(timeout=0.1)
+        while msg is not None and self._running:
+            yield msg
+            msg = get(timeout=0)
+
     def run(self):
+        ring = self.ring
+        push = ring.append
+        msg_last_ts, last_ts = self._msg_last_ts, self._last_ts
+        get_entry = MSG_TABLE.get
         try:
             while self._running:
-                msg = self.bus.recv(timeout=0.1)
-                if msg is None:
-                    continue
-
-                mdef = get_message(dbc, msg.arbitration_id, msg.is_extended_id)
-                if mdef is None:
-                    continue                                    # not in DBC
-
-                try:
-                    decoded = mdef.decode(msg.data,
-                                          allow_truncated=False,
-                                          decode_choices=True)
-                except cantools.DecodeError:
-                    continue
-
-                now = msg.timestamp
-                for sig_name, val in decoded.items():
-                    qkey  = f"{mdef.name}.{sig_name}"
-                    cycle = 0.0
-                    if qkey in self._last_ts:
-                        cycle = round((now - self._last_ts[qkey]) * 1000, 1)
-                    self._last_ts[qkey] = now
-                    unit = mdef.get_signal_by_name(sig_name).unit or ""
-                    self.new_signal.emit(msg.arbitration_id,
-                                         msg.is_extended_id,
-                                         mdef.name,
-                                         sig_name,
-                                         val,
-                                         unit,
-                                         cycle)
+                for msg in self._bursts():
+                    entry = get_entry(msg.arbitration_id | (msg.is_extended_id << 31))
+                    if entry is None:
+                        continue                                    # not in DBC
+                    mdef, msg_idx, sig_ids, mux_ids, has_choices, plan = entry
+                    now = msg.timestamp
+
+                    if plan is not None:
+                        values = decode_plain(msg.data, plan)
+                        if values is None:
+                            continue                            # truncated frame
+                    else:
+                        try:
+                            decoded = mdef.decode(msg.data,
+                                                  allow_truncated=False,
+                                                  decode_choices=has_choices)
+                        except cantools.DecodeError:
+                            continue
+                        if mux_ids is not None:
+                            over = len(decoded) - (RING_SIZE - len(ring))
+                            if over > 0:
+                                self.dropped += over
+                            for sig_name, val in decoded.items():
+                                sid = mux_ids[sig_name]
+                                last = last_ts[sid]
+                                # tenths of a ms, rounded: the model's unit
+                                cycle = int((now - last) * 10_000 + 0.5) if last else 0
+                                last_ts[sid] = now
+                                push((sid, val, cycle, 1))
+                            continue
+                        values = decoded.values()
+
+                    last = msg_last_ts[msg_idx]
+                    cycle = int((now - last) * 10_000 + 0.5) if last else 0
+                    msg_last_ts[msg_idx] = now
+                    over = len(sig_ids) - (RING_SIZE - len(ring))
+                    if over > 0:
+                        self.dropped += over
+                    for sid, val in zip(sig_ids, values):
+                        push((sid, val, cycle, 1))
         finally:
+            self.notifier.stop()
             self.bus.shutdown()
 
     def stop(self):
@@ -96,31 +173,16 @@ class CanReader(QThread):
 
 # ───────── GUI Window ─────────
 class MainWindow(QMainWindow):
-    """
-    Columns:
-        0  Msg ID
-        1  Msg Name
-        2  Signal Name
-        3  Value
-        4  Unit
-        5  Cycle-Time (ms)
-        6  Count
-    """
-    headers = ["Message ID", "Message Name", "Signal Name",
-               "Value", "Unit", "Cycle Time (ms)", "Count"]
-
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Live CAN Signal Viewer – with Count (v2)")
         self.resize(1150, 650)
 
-        self.table = QTableWidget(0, len(self.headers))
-        self.table.setHorizontalHeaderLabels(self.headers)
+        self.model = CanTableModel(SIG_INFO, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-
-        self.row_map:   Dict[str, int] = {}
-        self.count_map: Dict[str, int] = {}
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
 
         self.restart_button = QPushButton("Restart Count")
         self.restart_button.clicked.connect(self.restart_counts)
@@ -129,43 +191,46 @@ class MainWindow(QMainWindow):
         root = QWidget(); root.setLayout(lay); self.setCentralWidget(root)
 
         self.reader = CanReader()
-        self.reader.new_signal.connect(self.update_row)
         self.reader.start()
 
-    def restart_counts(self):
-        self.count_map.clear()
-        for row in range(self.table.rowCount()):
-            self.table.item(row, 6).setText("0")
-
-    def update_row(self, frame_id: int, is_ext: bool, msg_name: str, sig_name: str,
-                   value: float, unit: str, cycle_ms: float):
-        key  = f"{msg_name}.{sig_name}"
-        row  = self.row_map.get(key)
+        # reader.dropped is only written by the reader; Restart Count moves
+        # the base instead of resetting it
+        self._dropped_base = self._dropped_shown = 0
+        self.drain_timer = QTimer(self)
+        self.drain_timer.timeout.connect(self.drain_ring)
+        self.drain_timer.start(DRAIN_MS)
+
+    def drain_ring(self):
+        """Apply up to DRAIN_MAX buffered records in one GUI-thread pass."""
+        dropped = self.reader.dropped - self._dropped_base
+        if dropped != self._dropped_shown:
+            self._dropped_shown = dropped
+            self.statusBar().showMessage(
+                f"{dropped} records dropped: display fell behind, "
+                f"counts and cycle times are incomplete")
+        ring = self.reader.ring
+        n = min(len(ring), DRAIN_MAX)
+        if not n:
+            return
+        # Only the newest value per signal is visible, so collapse the batch
+        # first; counts still see every record.
+        pop = ring.popleft
+        latest: Dict[int, Tuple[object, int, int]] = {}
+        for _ in range(n):
+            sid, value, cycle, count_delta = pop()
+            prev = latest.get(sid)
+            latest[sid] = (value, cycle,
+                           prev[2] + count_delta if prev else count_delta)
+        self.model.apply(latest)
 
-        try:
-            id_text  = f"0x{frame_id:X}" + (" (EXT)" if is_ext else "")
-            val_text = str(value)
-            cyc_text = f"{cycle_ms:.1f}" if cycle_ms else "—"
-            count    = self.count_map.get(key, 0) + 1
-            self.count_map[key] = count
-
-            if row is None:
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-                for col, text in enumerate([id_text, msg_name, sig_name,
-                                            val_text, unit, cyc_text, str(count)]):
-                    self.table.setItem(row, col, QTableWidgetItem(text))
-                self.row_map[key] = row
-            else:
-                self.table.item(row, 0).setText(id_text)
-                self.table.item(row, 3).setText(val_text)
-                self.table.item(row, 5).setText(cyc_text)
-                self.table.item(row, 6).setText(str(count))
-
-        except Exception as e:
-            print(f"⚠️ GUI update error for {key}: {e}")
+    def restart_counts(self):
+        self.model.reset_counts()
+        self._dropped_base = self.reader.dropped
+        self._dropped_shown = 0
+        self.statusBar().clearMessage()
 
     def closeEvent(self, event):
+        self.drain_timer.stop()
         self.reader.stop()
         super().closeEvent(event)
 
@@ -0,0 +1,30 @@
+"""csvTostandardizedDBC.py output pinned to a DBC from the original script."""
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+HERE = Path(__file__).resolve().parent
+SCRIPT = HERE.parent / "csvTostandardizedDBC.py"
+
+
+def test_converter_output_is_unchanged(tmp_path):
+    # the script reads ../data/signals.csv relative to itself
+    (tmp_path / "CAN_tools").mkdir()
+    (tmp_path / "data").mkdir()
+    shutil.copy(SCRIPT, tmp_path / "CAN_tools")
+    shutil.copy(HERE / "data" / "signals.csv", tmp_path / "data")
+
+    run = subprocess.run([sys.executable, str(tmp_path / "CAN_tools" / SCRIPT.name)],
+                         capture_output=True, text=True, encoding="utf-8")
+    assert run.returncode == 0, run.stderr
+
+    out = (tmp_path / "data" / "DBC_sample_cantools.dbc").read_bytes()
+    assert out == (HERE / "data" / "expected.dbc").read_bytes()
+    assert ("Overlap in message 0x100 (ctx BASE) overlaps bits "
+            "[20, 21, 22, 23, 24, 25, 26, 27]") in run.stdout
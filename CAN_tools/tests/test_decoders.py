@@ -0,0 +1,149 @@
+"""The fast decoders checked against reference decoders on random frames."""
+import random
+
+import pytest
+
+cantools = pytest.importorskip("cantools")
+pytest.importorskip("can")
+pytest.importorskip("PySide6")
+pytest.importorskip("tkinter")      # decode_signal_fun_validater is a Tk app
+
+from _decode_plan import compile_plan, decode_plain
+from PCAN_can_decoder import SignalDef, build_layouts, decode_all
+from decode_signal_fun_validater import decode_signal
+
+ORDERS = ("Intel", "Motorola")
+
+
+def _random_signal(rng: random.Random, size: int) -> SignalDef:
+    """A signal that fits a *size*-byte frame, in Vector numbering."""
+    order = rng.choice(ORDERS)
+    length = rng.randint(1, min(64, 8 * size))
+    sig = dict(msg_id=1, name="s", length=length, byte_order=order,
+               is_signed=rng.random() < 0.5,
+               scale=rng.choice((1.0, 0.1, 0.125, 2.5)),
+               offset=rng.choice((0.0, -40.0, 10.0)))
+    if order == "Intel":
+        return SignalDef(start=rng.randint(0, 8 * size - length), **sig)
+    while True:
+        d = SignalDef(start=rng.randint(0, 8 * size - 1), **sig)
+        if all(0 <= byte < size for byte, _ in d.bit_indices):
+            return d
+
+
+def test_decode_all_matches_reference():
+    rng = random.Random(1)
+    for _ in range(3000):
+        size = rng.choice((1, 2, 4, 8))
+        d = _random_signal(rng, size)
+        layout = build_layouts({1: [d]})[1]
+        payload = bytes(rng.randrange(256) for _ in range(size))
+        expected = decode_signal(payload, d.start, d.length, d.byte_order,
+                                 d.is_signed, d.scale, d.offset)
+        assert decode_all(payload, layout) == [("s", pytest.approx(expected))]
+
+
+def test_decode_all_decodes_a_whole_message():
+    rng = random.Random(2)
+    defs = [SignalDef(1, f"s{i}", **kw) for i, kw in enumerate((
+        dict(start=0, length=16, byte_order="Intel", is_signed=False, scale=1, offset=0),
+        dict(start=16, length=8, byte_order="Intel", is_signed=True, scale=1, offset=-40),
+        dict(start=31, length=12, byte_order="Motorola", is_signed=False, scale=0.1, offset=0),
+        dict(start=37, length=3, byte_order="little", is_signed=True, scale=2, offset=1),
+        dict(start=55, length=16, byte_order="big_endian", is_signed=True, scale=1, offset=0),
+    ))]
+    layout = build_layouts({1: defs})[1]
+    for _ in range(200):
+        payload = bytes(rng.randrange(256) for _ in range(8))
+        expected = [(d.name, pytest.approx(decode_signal(
+                        payload, d.start, d.length, d.byte_order,
+                        d.is_signed, d.scale, d.offset))) for d in defs]
+        assert decode_all(payload, layout) == expected
+
+
+@pytest.mark.parametrize("order", ORDERS)
+def test_decode_all_skips_signals_past_a_short_frame(order):
+    rng = random.Random(3)
+    for _ in range(500):
+        d = _random_signal(rng, 8)
+        if d.byte_order != order:
+            continue
+        layout = build_layouts({1: [d]})[1]
+        payload = bytes(rng.randrange(256) for _ in range(8))
+        assert decode_all(payload[:d.span], layout) != []
+        assert decode_all(payload[:d.span - 1], layout) == []
+
+
+# ---- decode_plain against cantools ----------------------------------------
+def _random_dbc(rng: random.Random, messages: int = 40) -> str:
+    """DBC text with random, non-overlapping plain integer signals."""
+    lines = ['VERSION ""', "", "NS_ :", "", "BS_:", "", "BU_: ECU", ""]
+    for m in range(messages):
+        size = rng.choice((1, 2, 3, 4, 8, 12, 64))
+        lines.append(f"BO_ {0x100 + m} M{m}: {size} ECU")
+        used = set()                # occupied bits, 8 * byte + bit
+        for s in range(rng.randint(1, 6)):
+            length = rng.randint(1, min(64, 8 * size))
+            if rng.random() < 0.5:
+                start, order = rng.randint(0, 8 * size - length), 1
+                bits = set(range(start, start + length))
+            else:
+                # big-endian start is the MSB in sawtooth numbering
+                msb = rng.randint(0, 8 * size - length)
+                start, order = 8 * (msb // 8) + 7 - msb % 8, 0
+                bits = {8 * (q // 8) + 7 - q % 8 for q in range(msb, msb + length)}
+            if bits & used:
+                continue            # cantools cannot unpack overlapping signals
+            used |= bits
+            sign = rng.choice("+-")
+            scale = rng.choice(("1", "0.5", "0.125", "3"))
+            offset = rng.choice(("0", "-40", "12.5"))
+            lines.append(f' SG_ S{s} : {start}|{length}@{order}{sign} '
+                         f'({scale},{offset}) [0|0] "" ECU')
+        lines.append("")
+    return "\n".join(lines)
+
+
+def test_decode_plain_matches_cantools():
+    rng = random.Random(4)
+    db = cantools.database.load_string(_random_dbc(rng))
+    for mdef in db.messages:
+        plan = compile_plan(mdef)
+        assert plan is not None
+        for _ in range(25):
+            data = bytes(rng.randrange(256) for _ in range(mdef.length))
+            expected = list(mdef.decode(data, decode_choices=False).values())
+            assert decode_plain(data, plan) == pytest.approx(expected)
+            # trailing bytes beyond the DLC are ignored, a short frame is not decoded
+            assert decode_plain(data + b"\xff", plan) == pytest.approx(expected)
+            assert decode_plain(data[:-1], plan) is None
+
+
+def test_compile_plan_leaves_special_messages_to_cantools():
+    db = cantools.database.load_string('''VERSION ""
+
+NS_ :
+
+BS_:
+
+BU_: ECU
+
+BO_ 1 Mux: 2 ECU
+ SG_ Sel M : 0|8@1+ (1,0) [0|0] "" ECU
+ SG_ A m0 : 8|8@1+ (1,0) [0|0] "" ECU
+
+BO_ 2 Choices: 1 ECU
+ SG_ Gear : 0|8@1+ (1,0) [0|0] "" ECU
+
+BO_ 3 Float: 4 ECU
+ SG_ F : 0|32@1- (1,0) [0|0] "" ECU
+
+BO_ 4 Plain: 1 ECU
+ SG_ P : 0|8@1+ (1,0) [0|0] "" ECU
+
+SIG_VALTYPE_ 3 F : 1;
+VAL_ 2 Gear 0 "P" 1 "D" ;
+''')
+    plans = {m.name: compile_plan(m) for m in db.messages}
+    assert plans == {"Mux": None, "Choices": None, "Float": None,
+                     "Plain": (1, ((False, 0, 0xFF, 0, 1, 0),))}
@@ -1,11 +1,85 @@
 # can_frame/frame_page.py
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTableWidget,
-    QTableWidgetItem, QPushButton, QHBoxLayout
+    QWidget, QVBoxLayout, QLabel, QTableView,
+    QPushButton, QHBoxLayout
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 import time
 
+# "00" … "FF": payload bytes are looked up instead of formatted one by one
+_HEX_LUT = [f"{i:02X}" for i in range(256)]
+
+
+class CANFrameModel(QAbstractTableModel):
+    """One row per CAN ID. Raw values are stored as received; the text for a
+    cell is built in data(), i.e. only for rows the view actually paints."""
+    headers = ["CAN ID", "DLC", "Data", "Cycle Time (ms)", "Count"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.can_id_to_row = {}
+        # indexed by row
+        self.can_ids = []
+        self.dlcs = []
+        self.payloads = []      # data list as received from the driver
+        self.cycle_times = []
+        self.counts = []
+
+    # ---- Qt model interface ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.can_ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            return hex(self.can_ids[row])
+        if col == 1:
+            return str(self.dlcs[row])
+        if col == 2:
+            return " ".join(map(_HEX_LUT.__getitem__, self.payloads[row]))
+        if col == 3:
+            return str(self.cycle_times[row])
+        return str(self.counts[row])
+
+    # ---- updates ----
+    def update_frame(self, can_id, dlc, data, cycle_time):
+        row = self.can_id_to_row.get(can_id)
+        if row is None:
+            row = len(self.can_ids)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.can_id_to_row[can_id] = row
+            self.can_ids.append(can_id)
+            self.dlcs.append(dlc)
+            self.payloads.append(data)
+            self.cycle_times.append(cycle_time)
+            self.counts.append(1)
+            self.endInsertRows()
+            return
+        self.dlcs[row] = dlc
+        self.payloads[row] = data
+        self.cycle_times[row] = cycle_time
+        self.counts[row] += 1
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 4), [Qt.DisplayRole])
+
+    def reset_counts(self):
+        self.counts = [0] * len(self.can_ids)
+        if self.can_ids:
+            col = len(self.headers) - 1
+            self.dataChanged.emit(self.index(0, col),
+                                  self.index(len(self.can_ids) - 1, col),
+                                  [Qt.DisplayRole])
+
+
 class CANFramePage(QWidget):
     def __init__(self):
         super().__init__()
@@ -15,9 +89,9 @@ class CANFramePage(QWidget):
         self.layout.addWidget(self.status_label)
 
         # --- Table ---
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["CAN ID", "DLC", "Data", "Cycle Time (ms)", "Count"])
+        self.model = CANFrameModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.layout.addWidget(self.table)
 
         # --- Control Button Layout ---
@@ -29,39 +103,19 @@ class CANFramePage(QWidget):
         self.layout.addLayout(button_layout)
 
         # --- Data Structures ---
-        self.can_id_to_row = {}
         self.last_timestamp = {}
-        self.frame_count = {}
 
     def update_table(self, frame):
         can_id = frame.CAN_ID
-        dlc = frame.DLC
-        data_str = " ".join([f"{b:02X}" for b in frame.data])
         now = time.time() * 1000  # ms
 
-        if can_id in self.can_id_to_row:
-            row = self.can_id_to_row[can_id]
-        else:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.can_id_to_row[can_id] = row
-            self.table.setItem(row, 0, QTableWidgetItem(hex(can_id)))
-
-        self.table.setItem(row, 1, QTableWidgetItem(str(dlc)))
-        self.table.setItem(row, 2, QTableWidgetItem(data_str))
-
         cycle_time = 0
         if can_id in self.last_timestamp:
             cycle_time = int(now - self.last_timestamp[can_id])
         self.last_timestamp[can_id] = now
-        self.table.setItem(row, 3, QTableWidgetItem(str(cycle_time)))
 
-        # Update count
-        self.frame_count[can_id] = self.frame_count.get(can_id, 0) + 1
-        self.table.setItem(row, 4, QTableWidgetItem(str(self.frame_count[can_id])))
+        self.model.update_frame(can_id, frame.DLC, frame.data, cycle_time)
 
     def reset_counts(self):
         # Reset the count values
-        for can_id, row in self.can_id_to_row.items():
-            self.frame_count[can_id] = 0
-            self.table.setItem(row, 4, QTableWidgetItem("0"))
+        self.model.reset_counts()
@@ -2,6 +2,7 @@
 # Dynamically loads and interacts with any J2534-compatible DLL
 
 import ctypes
+from ctypes import addressof, string_at
 from enum import Enum
 from pathlib import Path
 
@@ -106,16 +107,11 @@ class J2534Driver:
         if status != 0:
             return None
 
-        raw_data = bytearray(msg.Data)
-        can_id = (
-            (raw_data[0] << 24) |
-            (raw_data[1] << 16) |
-            (raw_data[2] << 8) |
-            raw_data[3]
-        )
-
+        # Copy only the ID header + payload out of the 4 KB buffer (one memcpy)
         dlc = msg.DataSize - 4
-        data = [raw_data[4 + i] for i in range(dlc)]
+        raw_data = string_at(addressof(msg.Data), 4 + min(max(dlc, 0), 4024))
+        can_id = int.from_bytes(raw_data[:4], "big")
+        data = list(raw_data[4:])
 
         frame = CANFrame()
         frame.CAN_ID = can_id
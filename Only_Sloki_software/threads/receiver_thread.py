@@ -10,6 +10,8 @@ class CANReceiverThread(QThread):
         self._running = True
 
     def run(self):
+        # Keep the RX loop ahead of GUI painting so the driver queue never overruns
+        self.setPriority(QThread.TimeCriticalPriority)
         while self._running:
             # Block for up to 10 ms, return earlier if a frame is available
             frame = self.can_interface.receive(timeout=10)
@@ -4,26 +4,25 @@ PEAK_API.py  –  one stop for hardware details.
 Exposes
     get_config_and_bus() -> (settings_dict, bus_like_object)
 
-The returned `bus.recv()` always yields a `SimpleMessage` with:
+The returned `bus.recv(timeout)` yields a message (python-can's `can.Message`
+on real hardware, no copy per frame) or None; the app only reads its
     arbitration_id • is_extended_id • data • timestamp
-so the rest of the app never touches python-can directly.
+Always pass a timeout: on real hardware `recv` is python-can's own method,
+which blocks until a frame arrives when called without one.
+Both bus objects can also be handed to `can.Notifier`.
 """
 from pathlib import Path
 from typing import Dict, Tuple
-from collections import namedtuple
 import sys
 import os
 import ctypes
+import functools
+import threading
 
 # ---- user knob: run without hardware ----------------------
 USE_DUMMY_BUS = False           # True → GUI runs, but no real frames
 # -----------------------------------------------------------
 
-SimpleMessage = namedtuple(
-    "SimpleMessage",
-    ["arbitration_id", "is_extended_id", "data", "timestamp"]
-)
-
 # -----------------------------------------------------------#
 def _resolve_base_dir() -> Path:
     if hasattr(sys, "_MEIPASS"):
@@ -33,6 +32,7 @@ def _resolve_base_dir() -> Path:
     return Path(__file__).resolve().parent
 
 
+@functools.cache                 # main.py may already have run it at start-up
 def _preload_pcanbasic_dll() -> None:
     """Best-effort load of PCANBasic.dll from alongside the executable.
 
@@ -69,20 +69,17 @@ def _make_real_bus(settings):
         kwargs.update(fd=True, bitrate_fd=settings["DATA_PHASE"])
     real_bus = can.Bus(**kwargs)
 
-    # Wrap to emit SimpleMessage
+    # Wrap only to give send() the (frame_id, is_extended, data) signature
     class WrappedBus:
         def __init__(self):
             # capture outer scope references
             self._real = real_bus
             self._settings = settings
-        def recv(self, timeout=0.1):
-            msg = self._real.recv(timeout)
-            if msg is None:
-                return None
-            return SimpleMessage(msg.arbitration_id,
-                                 msg.is_extended_id,
-                                 msg.data,
-                                 msg.timestamp)
+            # python-can's Message already has the four fields the app reads
+            self.recv = real_bus.recv
+            # what can.Notifier looks up besides recv()
+            self.fileno = real_bus.fileno
+            self.channel_info = real_bus.channel_info
         def send(self, frame_id: int, is_extended: bool, data: bytes | bytearray):
             """Send a CAN (or CAN FD) frame.
 
@@ -107,8 +104,15 @@ def _make_real_bus(settings):
 class DummyBus:
     """Stand-in when hardware unavailable."""
     IS_DUMMY = True
+    channel_info = "dummy"
+    def __init__(self):
+        self._stop_evt = threading.Event()
+    def fileno(self):
+        # no OS handle: can.Notifier falls back to its polling thread
+        raise NotImplementedError
     def recv(self, timeout: float = 0.1):
-        import time; time.sleep(timeout)
+        # idle like a quiet bus, but wake at once when shutdown() is called
+        self._stop_evt.wait(timeout)
         return None
     def send(self, frame_id: int, is_extended: bool, data: bytes | bytearray):
         # Simulate success; print for visibility when console is open
@@ -118,7 +122,7 @@ class DummyBus:
             pass
         return True
     def shutdown(self):
-        pass
+        self._stop_evt.set()
 
 # -----------------------------------------------------------#
 def get_config_and_bus() -> Tuple[Dict[str, object], object]:
@@ -151,9 +155,9 @@ if __name__ == "__main__":
     print("Listening for 10 CAN messages...\n")
     count = 0
     while count < 10:
-        msg = bus.recv()
+        msg = bus.recv(timeout=0.1)
         if msg is not None:
-            print(f"[{count+1}] SimpleMessage:")
+            print(f"[{count+1}] Message:")
             print(f"  arbitration_id  : {hex(msg.arbitration_id)}")
             print(f"  is_extended_id  : {msg.is_extended_id}")
             print(f"  data            : {[hex(b) for b in msg.data]}")
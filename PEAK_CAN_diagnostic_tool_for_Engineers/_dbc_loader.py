@@ -0,0 +1,74 @@
+"""
+_dbc_loader.py  –  parse a DBC once and keep the result across runs.
+
+    load_dbc_cached(path) -> cantools.database.can.Database
+    load_dbc(path)        -> same, memoised per process
+
+Parsing a DBC is the slowest part of start-up, so the parse is pickled next
+to the scripts (next to the exe when frozen) and reused while the file's
+path, mtime and size and the cantools version are unchanged.  Anything that
+does not unpickle to a cantools Database is ignored and re-parsed.
+
+The same file is vendored in CAN_tools/ and PEAK_CAN_diagnostic_tool_for_Engineers/
+so each folder stays self-contained (PyInstaller bundles the Engineers one);
+keep the copies identical.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+
+
+def _resolve_cache_dir() -> Path:
+    # Use the folder next to the executable when frozen, else module folder
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).resolve().parent
+    return Path(__file__).resolve().parent
+
+
+CACHE_DIR = _resolve_cache_dir()
+
+
+def _pickle_path(path: Path, cantools_version: str) -> Path:
+    """Cache file for the current version of *path* (and of cantools).
+
+    dbc_cache_<source>_<state>.pkl: <source> hashes the DBC's path, so
+    older caches of the same DBC can be found and removed.
+    """
+    path = path.resolve()
+    st = path.stat()
+    source = hashlib.md5(str(path).encode()).hexdigest()[:16]
+    state = hashlib.md5(f"{st.st_mtime_ns}:{st.st_size}:{cantools_version}".encode()).hexdigest()[:16]
+    return CACHE_DIR / f"dbc_cache_{source}_{state}.pkl"
+
+
+def load_dbc_cached(path):
+    """Parse *path*, or unpickle the previous parse if the file is unchanged."""
+    import cantools                       # deferred: importing this module stays cheap
+    cache = _pickle_path(Path(path), cantools.__version__)
+    try:
+        db = pickle.loads(cache.read_bytes())
+        if isinstance(db, cantools.database.can.Database):
+            return db
+    except Exception:
+        pass                              # missing / stale / unreadable → reparse
+
+    db = cantools.database.load_file(str(path))
+    try:
+        source_prefix = cache.name.rsplit("_", 1)[0]
+        for old in CACHE_DIR.glob(f"{source_prefix}_*.pkl"):
+            old.unlink()                  # earlier versions of this DBC
+        tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(db, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, cache)            # atomic: readers never see half a file
+    except Exception:
+        pass                              # caching is best-effort (read-only dir …)
+    return db
+
+
+@functools.lru_cache(maxsize=None)
+def load_dbc(path: str):
+    """Parse *path* on first use; later calls return the cached Database."""
+    return load_dbc_cached(path)
@@ -0,0 +1,126 @@
+"""
+_signal_table_model.py  –  the live viewers' one-row-per-signal table model.
+
+    CanTableModel(sig_info, parent=None)
+    model.apply({sig_idx: (value, cycle, hits), …})
+    model.reset_counts()
+
+sig_info[sig_idx] is (frame_id, is_ext, msg name, signal name, unit); only
+(sig_idx, value, cycle, hits) travels from a reader to the model.  cycle is
+in tenths of a millisecond, 0 meaning "first reception".
+
+The same file is vendored in CAN_tools/ and PEAK_CAN_diagnostic_tool_for_Engineers/
+so each folder stays self-contained (PyInstaller bundles the Engineers one);
+keep the copies identical.
+"""
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+SigInfo = Tuple[int, bool, str, str, str]   # (frame_id, is_ext, msg, sig, unit)
+
+MAX_RUNS = 32          # dirty row runs per apply() before one bounding dataChanged
+
+
+def _row_runs(rows: List[int]):
+    """Yield (first, last) for each run of consecutive row numbers in *rows*."""
+    rows = sorted(rows)
+    first = prev = rows[0]
+    for r in rows[1:]:
+        if r != prev + 1:
+            yield first, prev
+            first = r
+        prev = r
+    yield first, prev
+
+
+class CanTableModel(QAbstractTableModel):
+    """
+    One row per signal, stored column-wise; text is formatted in data() only
+    for the cells the view actually paints.  Rows appear in order of first
+    reception.
+    """
+    headers = ["Message ID", "Message Name", "Signal Name",
+               "Value", "Unit", "Cycle Time (ms)", "Count"]
+
+    def __init__(self, sig_info: Sequence[SigInfo], parent=None):
+        super().__init__(parent)
+        self.sig_info = sig_info
+        n = len(sig_info)
+        # indexed by sig_idx
+        self.row_map = [-1] * n                  # sig_idx → row (-1: not shown yet)
+        self.values: list = [None] * n
+        self.cycles = array("q", [0]) * n        # tenths of a ms, 0 = first
+        self.counts = array("I", [0]) * n
+        # indexed by row
+        self.row_sig: List[int] = []             # row → sig_idx
+
+    # ---- Qt model interface ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.row_sig)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        sid, col = self.row_sig[index.row()], index.column()
+        if col == 3:
+            return str(self.values[sid])
+        if col == 5:
+            cycle = self.cycles[sid]
+            return f"{cycle / 10:.1f}" if cycle else "—"
+        if col == 6:
+            return str(self.counts[sid])
+        frame_id, is_ext, msg_name, sig_name, unit = self.sig_info[sid]
+        if col == 0:
+            return f"0x{frame_id:X}" + (" (EXT)" if is_ext else "")
+        if col == 1:
+            return msg_name
+        if col == 2:
+            return sig_name
+        return unit
+
+    # ---- updates from the drain timer ----
+    def apply(self, latest: Dict[int, Tuple[object, int, int]]) -> None:
+        """Store the newest (value, cycle, hits) per sig_idx, then emit dataChanged."""
+        row_map, values, cycles, counts = (self.row_map, self.values,
+                                           self.cycles, self.counts)
+        dirty: List[int] = []
+        for sid, (value, cycle, hits) in latest.items():
+            values[sid] = value
+            cycles[sid] = cycle
+            counts[sid] += hits
+            row = row_map[sid]
+            if row < 0:
+                row = len(self.row_sig)
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.row_sig.append(sid)
+                row_map[sid] = row
+                self.endInsertRows()
+                continue
+            dirty.append(row)
+        if dirty:
+            # only Value…Count (cols 3–6) change after insert; one signal per
+            # contiguous block of rows, or a single bounding block if scattered
+            runs = list(_row_runs(dirty))
+            if len(runs) > MAX_RUNS:
+                runs = [(runs[0][0], runs[-1][1])]
+            for first, last in runs:
+                self.dataChanged.emit(self.index(first, 3), self.index(last, 6),
+                                      [Qt.DisplayRole])
+
+    def reset_counts(self) -> None:
+        self.counts = array("I", [0]) * len(self.sig_info)
+        if self.row_sig:
+            col = len(self.headers) - 1
+            self.dataChanged.emit(self.index(0, col),
+                                  self.index(len(self.row_sig) - 1, col),
+                                  [Qt.DisplayRole])
@@ -7,12 +7,24 @@ Behavior:
 - No predefined fallback path is used. If not configured, loading raises with
     a helpful message asking to set the path via the Settings page.
 - Exposes get_dbc() to get a cached cantools database, and DBC_PATH for display.
+- A parsed DBC is pickled next to settings.json by _dbc_loader (the same
+    loader as CAN_tools), so later starts skip cantools' text parse.
+- Importing this module is cheap: cantools is imported and the DBC parsed on
+    the first get_dbc() call or the first access to `dbc`.
+- FRAME_MAP / SIGNAL_META: frame-key → message / signal metadata, built once
+    when the DBC loads.
 """
 
 from pathlib import Path
 import sys
 import json
-import cantools
+import threading
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from _dbc_loader import load_dbc_cached
+
+if TYPE_CHECKING:                       # annotations only; imported lazily at runtime
+    import cantools
 
 def _resolve_app_dir() -> Path:
     # Use the folder next to the executable when frozen, else module folder
@@ -25,6 +37,17 @@ BASE_DIR = APP_DIR.parent
 SETTINGS_PATH = APP_DIR / "settings.json"
 
 _dbc_cache = None
+_dbc_cache_path: Path | None = None     # DBC file _dbc_cache was parsed from
+_dbc_lock = threading.Lock()            # main.py may warm the cache from a worker
+
+# Frame key = frame_id | (is_extended << 31), so an 11-bit and a 29-bit frame
+# with the same numeric ID never collide. Look up with
+#     FRAME_MAP.get(msg.arbitration_id | (msg.is_extended_id << 31))
+FRAME_MAP: Dict[int, "cantools.database.can.Message"] = {}
+
+# frame key → ((sig_name, unit), …) in mdef.signals order, which is the order
+# decode() yields a non-multiplexed message's values in
+SIGNAL_META: Dict[int, Tuple[Tuple[str, str], ...]] = {}
 
 
 def _load_config_path() -> Path | None:
@@ -44,20 +67,39 @@ def get_dbc_path() -> Path | None:
 
 
 def get_dbc():
-    global _dbc_cache, DBC_PATH
-    # Always refresh DBC_PATH from settings for each process start
-    DBC_PATH = get_dbc_path()
-    if _dbc_cache is None:
-        if not DBC_PATH or not Path(DBC_PATH).exists():
-            raise FileNotFoundError(
-                "DBC file not configured. Open Settings and select a .dbc file."
+    global _dbc_cache, _dbc_cache_path, DBC_PATH
+    with _dbc_lock:
+        # Always refresh DBC_PATH from settings for each process start
+        DBC_PATH = get_dbc_path()
+        # a cache warmed before the user picked another DBC in Settings is stale
+        if _dbc_cache is None or (DBC_PATH and DBC_PATH != _dbc_cache_path):
+            if not DBC_PATH or not Path(DBC_PATH).exists():
+                raise FileNotFoundError(
+                    "DBC file not configured. Open Settings and select a .dbc file."
+                )
+            _dbc_cache = load_dbc_cached(Path(DBC_PATH))
+            _dbc_cache_path = DBC_PATH
+            FRAME_MAP.clear()
+            FRAME_MAP.update((m.frame_id | (m.is_extended_frame << 31), m)
+                             for m in _dbc_cache.messages)
+            SIGNAL_META.clear()
+            SIGNAL_META.update(
+                (key, tuple((s.name, s.unit or "") for s in m.signals))
+                for key, m in FRAME_MAP.items()
             )
-        _dbc_cache = cantools.database.load_file(Path(DBC_PATH))
-    return _dbc_cache
+        return _dbc_cache
 
 
 # Back-compat exports (some modules import dbc and DBC_PATH directly)
 DBC_PATH = get_dbc_path()
-dbc = get_dbc()
 
-__all__ = ["BASE_DIR", "DBC_PATH", "dbc", "get_dbc", "get_dbc_path"]
+
+def __getattr__(name: str):
+    # `dbc` is resolved on first access, so `from dbc_decode_input import dbc`
+    # still works but a plain import doesn't pay for cantools or the parse
+    if name == "dbc":
+        return get_dbc()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# `dbc` is served by __getattr__ above, so it is not listed here
+__all__ = ["BASE_DIR", "DBC_PATH", "FRAME_MAP", "SIGNAL_META", "get_dbc", "get_dbc_path"]
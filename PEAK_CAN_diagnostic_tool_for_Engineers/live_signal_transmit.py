@@ -1,9 +1,14 @@
+import functools
+import heapq
+import queue
 import sys
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Tuple, List
+from typing import Callable, Dict, Optional, Set, Tuple, List
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QPushButton, QGroupBox, QFormLayout, QRadioButton,
@@ -17,17 +22,31 @@ from PEAK_API import get_config_and_bus
 
 cfg, BUS = get_config_and_bus()
 
+REFRESH_MS = 100        # count / status label refresh period
+
+# Flags for the read-only text cells, combined once
+RO_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+def _ro_item(text: str, align: Optional[Qt.AlignmentFlag] = None) -> QTableWidgetItem:
+    """Non-editable table cell showing *text*."""
+    item = QTableWidgetItem(text)
+    item.setFlags(RO_FLAGS)
+    if align is not None:
+        item.setTextAlignment(align)
+    return item
+
 
 def _compute_physical_bounds(length_bits: int, is_signed: bool, scale: float, offset: float,
                              smin: Optional[float], smax: Optional[float]) -> Tuple[float, float]:
     if smin is not None and smax is not None:
         return float(smin), float(smax)
     if is_signed:
-        raw_min = -(2 ** (length_bits - 1))
-        raw_max = (2 ** (length_bits - 1)) - 1
+        raw_min = -(1 << (length_bits - 1))
+        raw_max = (1 << (length_bits - 1)) - 1
     else:
         raw_min = 0
-        raw_max = (2 ** length_bits) - 1
+        raw_max = (1 << length_bits) - 1
     phys_min = raw_min * scale + offset
     phys_max = raw_max * scale + offset
     if phys_min > phys_max:
@@ -40,6 +59,21 @@ def _decimals_for_step(step: float) -> int:
     return len(s[1]) if len(s) > 1 else 0
 
 
+@functools.lru_cache(maxsize=None)
+def _editor_range(length_bits: int, is_signed: bool, scale: float, offset: float,
+                  smin: Optional[float], smax: Optional[float]) -> Tuple[float, float, float, int]:
+    """(pmin, pmax, step, decimals) for a value editor.
+
+    Keyed by the signal's encoding fields: most DBC signals share a handful
+    of layouts (8-bit raw, 16-bit ×0.1, …), so each is worked out once.
+    """
+    pmin, pmax = _compute_physical_bounds(length_bits, is_signed, scale, offset, smin, smax)
+    if pmin == pmax:
+        pmax = pmin + max(scale, 1.0)
+    step = abs(scale) if scale != 0 else 1.0
+    return pmin, pmax, step, min(6, max(0, _decimals_for_step(step)))
+
+
 @dataclass
 class RowWidgets:
     # Compact holder for widgets and metadata per row
@@ -51,10 +85,20 @@ class RowWidgets:
     enable_chk: QCheckBox
     cycle_spin: QSpinBox
     count_item: QTableWidgetItem
-    next_due: Optional[float] = None
+    # mirrors of enable_chk / cycle_spin, kept current by their slots so the
+    # send and filter loops never query the widgets
+    enabled: bool = False
+    cycle_ms: int = 100
+    # frames sent for this row, and the value count_item currently shows;
+    # the send path only bumps count, _refresh_counts() updates the cell
+    count: int = 0
+    count_shown: int = 0
 
 
 class MainWindow(QMainWindow):
+    # (frame_id, gen, error text) from the TX thread; queued to the GUI thread
+    tx_failed = Signal(int, int, str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Live Signal Transmit")
@@ -75,8 +119,33 @@ class MainWindow(QMainWindow):
         self._rows: List[RowWidgets] = []
         self._msg_values: Dict[int, Dict[str, float]] = {}  # key: frame_id -> {sig_name: value}
         self._msg_group: Dict[int, List[RowWidgets]] = {}
-        # Per-message scheduler: frame_id -> {enabled, cycle_ms, next_due, mdef}
+        # value spin / enable checkbox / cycle spin → its row
+        self._sender_to_rw: Dict[QWidget, RowWidgets] = {}
+        # rows currently hidden by the filters
+        self._hidden_rows: Set[int] = set()
+        # Per-message scheduler: frame_id -> {enabled, cycle_ms, period_ns, mdef, gen}
         self._msg_sched: Dict[int, Dict[str, object]] = {}
+        # Min-heap of (due_ns, gen, frame_id) for enabled messages. One
+        # single-shot timer is armed for the earliest entry, so nothing runs
+        # while no message is enabled and each wake-up only touches the
+        # messages that are due. Bumping a message's gen invalidates its
+        # queued entry; stale entries are dropped when they reach the top.
+        self._heap: List[Tuple[int, int, int]] = []
+        self._sched_timer = QTimer(self)
+        self._sched_timer.setSingleShot(True)
+        self._sched_timer.timeout.connect(self._on_sched_timer)
+        # encode() and BUS.send() run on a TX thread so a slow encode never
+        # stalls painting: the GUI puts one batch of (frame_id, gen, mdef,
+        # values snapshot) per wake-up on _tx_q; the thread appends
+        # (frame_id, payload length) to _tx_done, which _refresh_counts()
+        # drains. One producer and one consumer on each side. A failure is
+        # signalled at once through tx_failed instead, and the thread skips
+        # that message's already-queued sends from the same schedule (gen).
+        self._tx_q: "queue.SimpleQueue[Optional[List[Tuple[int, int, object, Dict[str, float]]]]]" = queue.SimpleQueue()
+        self._tx_done: deque = deque()
+        # the TX thread runs while the window is shown (see showEvent)
+        self.tx_failed.connect(self._on_tx_failed)
+        self._tx_thread: Optional[threading.Thread] = None
         self._populate_rows()
 
         # Controls row
@@ -116,18 +185,36 @@ class MainWindow(QMainWindow):
         root = QWidget(); root.setLayout(root_layout)
         self.setCentralWidget(root)
 
-        # Timer for periodic transmission
-        self._timer = QTimer(self)
-        self._timer.setInterval(20)  # 50 Hz tick
-        self._timer.timeout.connect(self._on_tick)
-        self._timer.start()
         self._tx_total = 0
+        self._last_tx: Optional[Tuple[object, int]] = None   # (mdef, payload length)
+
+        # Counts and status are pushed to the widgets at display rate, not
+        # once per transmitted frame
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setTimerType(Qt.CoarseTimer)
+        self._refresh_timer.timeout.connect(self._refresh_counts)
 
         # Initialize filter to show all
         self._apply_filters()
 
     # ---- UI builders ----------------------------------------------------
     def _populate_rows(self):
+        # Build with painting, table signals and per-cell column sizing off;
+        # the header sizes every column once when ResizeToContents returns.
+        hdr = self.table.horizontalHeader()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        hdr.setSectionResizeMode(QHeaderView.Interactive)
+        try:
+            self._build_rows()
+        finally:
+            hdr.setSectionResizeMode(QHeaderView.ResizeToContents)
+            hdr.setStretchLastSection(True)
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+
+    def _build_rows(self):
         # Count all signals
         total_signals = sum(len(m.signals) for m in dbc.messages)
         self.table.setRowCount(total_signals)
@@ -139,22 +226,16 @@ class MainWindow(QMainWindow):
             self._msg_sched.setdefault(frame_id, {
                 "enabled": False,
                 "cycle_ms": 100,
-                "next_due": None,
+                "period_ns": 100_000_000,
                 "mdef": m,
+                "gen": 0,               # bumped to drop queued heap entries
             })
+            msg_id_txt = f"0x{frame_id:X}{' (EXT)' if m.is_extended_frame else ''}"
             for sig in m.signals:
                 # Columns 0-2: Message ID, Message Name, Signal Name
-                msg_id_item = QTableWidgetItem(f"0x{frame_id:X}{' (EXT)' if m.is_extended_frame else ''}")
-                msg_id_item.setFlags(msg_id_item.flags() ^ Qt.ItemIsEditable)
-                self.table.setItem(row_idx, 0, msg_id_item)
-
-                msg_name_item = QTableWidgetItem(m.name)
-                msg_name_item.setFlags(msg_name_item.flags() ^ Qt.ItemIsEditable)
-                self.table.setItem(row_idx, 1, msg_name_item)
-
-                sig_name_item = QTableWidgetItem(sig.name)
-                sig_name_item.setFlags(sig_name_item.flags() ^ Qt.ItemIsEditable)
-                self.table.setItem(row_idx, 2, sig_name_item)
+                self.table.setItem(row_idx, 0, _ro_item(msg_id_txt))
+                self.table.setItem(row_idx, 1, _ro_item(m.name))
+                self.table.setItem(row_idx, 2, _ro_item(sig.name))
 
                 # Column 3: Value editor (slider + spinbox compact)
                 value_widget, getter, initial_val = self._create_value_editor(sig)
@@ -163,19 +244,14 @@ class MainWindow(QMainWindow):
                 self._msg_values[frame_id][sig.name] = initial_val
 
                 # Column 4: Unit
-                unit_txt = sig.unit or ""
-                unit_item = QTableWidgetItem(str(unit_txt))
-                unit_item.setFlags(unit_item.flags() ^ Qt.ItemIsEditable)
-                self.table.setItem(row_idx, 4, unit_item)
+                self.table.setItem(row_idx, 4, _ro_item(str(sig.unit or "")))
 
                 # Column 5: Cycle time + enable checkbox
                 cyc_widget, enable_chk, cyc_spin = self._create_cycle_widget()
                 self.table.setCellWidget(row_idx, 5, cyc_widget)
 
                 # Column 6: Count
-                count_item = QTableWidgetItem("0")
-                count_item.setTextAlignment(Qt.AlignCenter)
-                count_item.setFlags(count_item.flags() ^ Qt.ItemIsEditable)
+                count_item = _ro_item("0", Qt.AlignCenter)
                 self.table.setItem(row_idx, 6, count_item)
 
                 # Track row
@@ -188,32 +264,26 @@ class MainWindow(QMainWindow):
                     enable_chk=enable_chk,
                     cycle_spin=cyc_spin,
                     count_item=count_item,
-                    next_due=None,
                 )
                 # Keep message values in sync when control changes
                 self._wire_value_change(rw)
                 # Start/stop scheduling when checkbox toggled
-                enable_chk.toggled.connect(lambda checked, r=rw: self._on_enable_toggled(r, checked))
+                self._sender_to_rw[enable_chk] = rw
+                enable_chk.toggled.connect(self._on_enable_toggled_from_sender)
                 # Cycle time changed → take this row's cycle for the message
-                cyc_spin.valueChanged.connect(lambda _val, r=rw: self._on_cycle_changed(r))
+                self._sender_to_rw[cyc_spin] = rw
+                cyc_spin.valueChanged.connect(self._on_cycle_changed_from_sender)
                 self._rows.append(rw)
                 self._msg_group[frame_id].append(rw)
 
                 row_idx += 1
 
-        # Resize for readability
-        self.table.resizeColumnsToContents()
-        self.table.horizontalHeader().setStretchLastSection(True)
-
     def _create_value_editor(self, sig):
         # Build compact value editor (slider + spinbox)
         scale = float(sig.scale or 1.0)
         offset = float(sig.offset or 0.0)
-        pmin, pmax = _compute_physical_bounds(sig.length, sig.is_signed, scale, offset, sig.minimum, sig.maximum)
-        if pmin == pmax:
-            pmax = pmin + max(scale, 1.0)
-        step = abs(scale) if scale != 0 else 1.0
-        decimals = min(6, max(0, _decimals_for_step(step)))
+        pmin, pmax, step, decimals = _editor_range(sig.length, bool(sig.is_signed), scale, offset,
+                                                   sig.minimum, sig.maximum)
 
         row = QWidget(); h = QHBoxLayout(); h.setContentsMargins(4, 0, 4, 0); h.setSpacing(6); row.setLayout(h)
         slider = QSlider(Qt.Horizontal); slider.setFixedHeight(18)
@@ -268,23 +338,35 @@ class MainWindow(QMainWindow):
         self._apply_filters()
 
     def _apply_filters(self):
-        pattern = (self.search_edit.text() or "").strip().lower()
+        pattern = (self.search_edit.text() or "").strip()
         only_enabled = self.only_enabled_chk.isChecked()
-        rc = self.table.rowCount()
-        for r in range(rc):
-            # search filter
-            item = self.table.item(r, 2)  # Signal Name column
-            name = item.text().lower() if item is not None else ""
-            matches = (pattern in name) if pattern else True
+        hidden = self._hidden_rows
+        if not pattern and not only_enabled:
+            # no filter active: just unhide what an earlier filter hid
+            for r in hidden:
+                self.table.setRowHidden(r, False)
+            hidden.clear()
+            return
+        # Substring match on the Signal Name column runs inside Qt:
+        # findItems() is case-insensitive unless asked otherwise
+        matches = None
+        if pattern:
+            matches = {item.row() for item in self.table.findItems(pattern, Qt.MatchContains)
+                       if item.column() == 2}
+        rows = self._rows
+        for r in range(self.table.rowCount()):
+            visible = matches is None or r in matches
             # enabled filter
-            enabled_ok = True
-            if only_enabled:
-                if 0 <= r < len(self._rows):
-                    enabled_ok = self._rows[r].enable_chk.isChecked()
-                else:
-                    enabled_ok = False
-            visible = matches and enabled_ok
-            self.table.setRowHidden(r, not visible)
+            if visible and only_enabled:
+                visible = r < len(rows) and rows[r].enabled
+            # only touch rows whose visibility changes
+            if visible:
+                if r in hidden:
+                    hidden.discard(r)
+                    self.table.setRowHidden(r, False)
+            elif r not in hidden:
+                hidden.add(r)
+                self.table.setRowHidden(r, True)
 
     def _wire_value_change(self, rw: 'RowWidgets'):
         # Update cached message value whenever the spin changes
@@ -296,81 +378,164 @@ class MainWindow(QMainWindow):
         if spin is None:
             return
 
-        frame_id = rw.msg.frame_id
+        self._sender_to_rw[spin] = rw
+        spin.valueChanged.connect(self._on_value_changed_from_sender)
+        # Set initial cached value
+        self._msg_values[rw.msg.frame_id][rw.sig.name] = rw.get_value()
 
-        def on_changed(val: float):
-            # Update value cache
-            self._msg_values[frame_id][rw.sig.name] = float(val)
+    # Row widgets connect straight to these bound methods and are mapped
+    # back to their row via sender(), instead of one closure per widget.
+    def _on_value_changed_from_sender(self, val: float):
+        rw = self._sender_to_rw[self.sender()]
+        # Update value cache
+        self._msg_values[rw.msg.frame_id][rw.sig.name] = float(val)
 
-        spin.valueChanged.connect(on_changed)
-        # Set initial cached value
-        self._msg_values[frame_id][rw.sig.name] = rw.get_value()
+    def _on_enable_toggled_from_sender(self, checked: bool):
+        self._on_enable_toggled(self._sender_to_rw[self.sender()], checked)
+
+    def _on_cycle_changed_from_sender(self, value: int):
+        self._on_cycle_changed(self._sender_to_rw[self.sender()], value)
 
     # ---- actions ---------------------------------------------------------
     def _on_enable_toggled(self, rw: 'RowWidgets', checked: bool):
         # Recompute message enabled if any row under same frame is enabled
+        rw.enabled = checked
         frame_id = rw.msg.frame_id
         group = self._msg_group.get(frame_id, [])
-        enabled = any(r.enable_chk.isChecked() for r in group)
+        enabled = any(r.enabled for r in group)
         sched = self._msg_sched[frame_id]
         sched["enabled"] = enabled
         if enabled:
-            sched["next_due"] = time.monotonic()  # send ASAP
+            self._kick(frame_id)  # send ASAP
         else:
-            sched["next_due"] = None
+            sched["gen"] += 1
 
-    def _on_cycle_changed(self, rw: 'RowWidgets'):
+    def _on_cycle_changed(self, rw: 'RowWidgets', value: int):
         # Take this row's cycle for the message and reset schedule
+        rw.cycle_ms = value
         self._set_msg_cycle_from_row(rw)
 
     def _set_msg_cycle_from_row(self, rw: 'RowWidgets'):
         frame_id = rw.msg.frame_id
         sched = self._msg_sched[frame_id]
-        sched["cycle_ms"] = int(max(1, rw.cycle_spin.value()))
-        sched["next_due"] = time.monotonic()
+        sched["cycle_ms"] = int(max(1, rw.cycle_ms))
+        sched["period_ns"] = sched["cycle_ms"] * 1_000_000
+        if sched["enabled"]:
+            self._kick(frame_id)
 
-    def _on_tick(self):
-        if not self._rows:
+    def _kick(self, frame_id: int):
+        """(Re)schedule the message so it sends now, then every cycle_ms."""
+        sched = self._msg_sched[frame_id]
+        sched["gen"] += 1
+        heapq.heappush(self._heap, (time.perf_counter_ns(), sched["gen"], frame_id))
+        self._arm()
+
+    def _arm(self):
+        """Point the scheduler timer at the earliest live heap entry."""
+        heap, msg_sched = self._heap, self._msg_sched
+        while heap and heap[0][1] != msg_sched[heap[0][2]]["gen"]:
+            heapq.heappop(heap)
+        if not heap:
+            self._sched_timer.stop()
             return
-        now = time.monotonic()
-        # For messages that are due, send once per message with merged values
-        for frame_id, sched in self._msg_sched.items():
-            if not sched["enabled"] or sched["next_due"] is None:
-                continue
-            if now + 1e-6 < sched["next_due"]:
-                continue
-            mdef = sched["mdef"]
-            # Values: use cached map
-            values = dict(self._msg_values.get(frame_id, {}))
+        # ns → whole ms, rounded up so the timer never fires before the due time
+        delay = max(0, -((time.perf_counter_ns() - heap[0][0]) // 1_000_000))
+        # coarse timers (±5 %) are fine from 20 ms up and let the OS keep its
+        # default timer resolution; an early wake-up just re-arms
+        self._sched_timer.setTimerType(Qt.CoarseTimer if delay >= 20 else Qt.PreciseTimer)
+        self._sched_timer.start(delay)
+
+    def _on_sched_timer(self):
+        heap, msg_sched = self._heap, self._msg_sched
+        now = time.perf_counter_ns()
+        due: List[int] = []
+        while heap and heap[0][0] <= now:
+            t, gen, frame_id = heapq.heappop(heap)
+            sched = msg_sched[frame_id]
+            if gen != sched["gen"]:
+                continue                    # disabled or rescheduled since
+            due.append(frame_id)
+            t += sched["period_ns"]         # integer ns: no drift over long runs
+            if t <= now:                    # fell behind: no catch-up burst
+                t = now + sched["period_ns"]
+            heapq.heappush(heap, (t, gen, frame_id))
+        if due:
+            self._send_due(due)
+        self._arm()
+
+    def _send_due(self, due: List[int]):
+        """Hand every message in *due* to the TX thread as one batch."""
+        batch = []
+        for frame_id in due:
+            values = self._msg_values[frame_id]
             # Ensure cached reflects the current widgets state for enabled rows
             for r in self._msg_group.get(frame_id, []):
-                if r.enable_chk.isChecked():
+                if r.enabled:
                     values[r.sig.name] = r.get_value()
-            try:
-                payload = mdef.encode(values)
-                BUS.send(mdef.frame_id, mdef.is_extended_frame, bytes(payload))
-            except Exception as ex:
-                # Disable all rows for this message to avoid spamming
-                for r in self._msg_group.get(frame_id, []):
-                    r.enable_chk.setChecked(False)
-                sched["enabled"] = False
-                sched["next_due"] = None
-                QMessageBox.critical(self, "Transmit Error", f"Failed to send {mdef.name}:\n{ex}")
-                continue
+            # the TX thread encodes later, so it gets its own copy
+            sched = self._msg_sched[frame_id]
+            batch.append((frame_id, sched["gen"], sched["mdef"], values.copy()))
+        self._tx_q.put(batch)
+
+    def _tx_loop(self):
+        """TX thread: encode and send each batch, report every frame back."""
+        get, done, send = self._tx_q.get, self._tx_done.append, BUS.send
+        failed: Dict[int, int] = {}         # frame_id → gen whose send failed
+        while True:
+            batch = get()
+            if batch is None:
+                return
+            i = 0
+            while i < len(batch):
+                # one try per batch; a failure is reported and the rest of
+                # the batch still goes out
+                try:
+                    for i in range(i, len(batch)):
+                        frame_id, gen, mdef, values = batch[i]
+                        if failed.get(frame_id) == gen:
+                            continue        # queued before the GUI disabled it
+                        payload = mdef.encode(values)
+                        send(mdef.frame_id, mdef.is_extended_frame, bytes(payload))
+                        done((frame_id, len(payload)))
+                    break
+                except Exception as ex:
+                    frame_id, gen = batch[i][0], batch[i][1]
+                    failed[frame_id] = gen
+                    self.tx_failed.emit(frame_id, gen, str(ex))
+                    i += 1
+
+    def _on_tx_failed(self, frame_id: int, gen: int, error: str):
+        sched = self._msg_sched[frame_id]
+        if not sched["enabled"] or sched["gen"] != gen:
+            return                  # already stopped or rescheduled since
+        # Disable all rows for this message to avoid spamming
+        sched["gen"] += 1
+        sched["enabled"] = False
+        for r in self._msg_group.get(frame_id, []):
+            r.enable_chk.setChecked(False)
+        QMessageBox.critical(self, "Transmit Error",
+                             f"Failed to send {sched['mdef'].name}:\n{error}")
+
+    def _refresh_counts(self):
+        """Apply TX results, then write changed counts and the status to the widgets."""
+        done = self._tx_done
+        while done:
+            frame_id, length = done.popleft()
             # Increment count for enabled rows
             for r in self._msg_group.get(frame_id, []):
-                if r.enable_chk.isChecked():
-                    try:
-                        count = int(r.count_item.text()) + 1
-                    except ValueError:
-                        count = 1
-                    r.count_item.setText(str(count))
-            # Update status
+                if r.enabled:
+                    r.count += 1
             self._tx_total += 1
-            self.status_lbl.setText(f"Last TX: 0x{mdef.frame_id:X} {mdef.name} len={len(payload)} total={self._tx_total}")
-            # Schedule next
-            period_s = max(1, int(sched["cycle_ms"])) / 1000.0
-            sched["next_due"] = now + period_s
+            self._last_tx = (self._msg_sched[frame_id]["mdef"], length)
+        for r in self._rows:
+            if r.count != r.count_shown:
+                r.count_item.setText(str(r.count))
+                r.count_shown = r.count
+        if self._last_tx is not None:
+            mdef, length = self._last_tx
+            self._last_tx = None
+            self.status_lbl.setText(f"Last TX: 0x{mdef.frame_id:X} {mdef.name} "
+                                    f"len={length} total={self._tx_total}")
 
     def _enable_all(self):
         for rw in self._rows:
@@ -380,9 +545,49 @@ class MainWindow(QMainWindow):
         for rw in self._rows:
             rw.enable_chk.setChecked(False)
 
+    # ---- pause while hidden ------------------------------------------------
+    def _resume(self):
+        """Start the TX thread and timers; enabled messages send again now."""
+        if self._tx_thread is None:
+            self._tx_thread = threading.Thread(target=self._tx_loop, name="can-tx", daemon=True)
+            self._tx_thread.start()
+        self._refresh_timer.start(REFRESH_MS)
+        for frame_id, sched in self._msg_sched.items():
+            if sched["enabled"]:
+                self._kick(frame_id)
+
+    def _pause(self):
+        """Stop scheduling and the TX thread; enable states are kept."""
+        self._sched_timer.stop()
+        self._heap.clear()
+        self._refresh_timer.stop()
+        if self._tx_thread is not None:
+            # the thread exits once it reaches the None; wait for it, so a
+            # later _resume() never runs a second _tx_loop on the same queue
+            self._tx_q.put(None)
+            self._tx_thread.join()
+            self._tx_thread = None
+        self._refresh_counts()
+
+    def showEvent(self, event):
+        if not event.spontaneous():         # not on restore from minimised
+            self._resume()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # keep transmitting while minimised; only an explicit hide pauses
+        if not event.spontaneous():
+            self._pause()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        self._pause()
+        super().closeEvent(event)
+
     def _clear_counts(self):
         for rw in self._rows:
-            rw.count_item.setText("0")
+            rw.count = 0
+        self._refresh_counts()
 
 
 def main():
@@ -1,79 +1,143 @@
 # live_signal_viewer.py
 import sys
-from typing import Dict
+import threading
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
 
+import can
 import cantools
-from PySide6.QtCore    import QThread, Signal
+from PySide6.QtCore    import QTimer
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QTableWidget, QTableWidgetItem,
+    QApplication, QMainWindow, QTableView,
     QVBoxLayout, QWidget, QPushButton
 )
 
 from PEAK_API import get_config_and_bus
-from dbc_decode_input import dbc, DBC_PATH
+from _signal_table_model import CanTableModel, SigInfo
+from dbc_decode_input import dbc, DBC_PATH, FRAME_MAP, SIGNAL_META
 
 cfg, BUS = get_config_and_bus()
 
 print(f"Loaded DBC: {DBC_PATH}  (messages: {len(dbc.messages)})")
 
-def get_message(dbc_db, frame_id: int, is_ext: bool):
-    lookup_id = frame_id | 0x8000_0000 if is_ext else frame_id
-    return dbc_db._frame_id_to_message.get(lookup_id)
-
-class CanReader(QThread):
-    new_signal = Signal(int, bool, str, str, float, str, float)
-    def __init__(self, bus):       # <- receives ready-to-use bus
+DRAIN_MS  = 33          # GUI drain period (~30 Hz)
+
+# Every DBC signal gets a dense sig_idx; SIG_INFO[sig_idx] holds its static
+# columns, so only (sig_idx, value, cycle) travels from the reader to the GUI
+# and both sides key their tables by that int instead of (msg, sig) strings.
+SIG_INFO: List[SigInfo] = []
+
+# Keyed like FRAME_MAP (bit 31 marks extended IDs). Each entry carries
+# everything the reader needs for that frame, so a frame costs one dict .get:
+#   key → (bound decode, length, sig_idx in signal order | None, {sig name: sig_idx})
+# Plain messages decode in signal order and are zipped against the ordered
+# sig_idx tuple; once the frame is long enough they cannot fail to decode,
+# so the reader checks the length instead of catching DecodeError.
+# Multiplexed (and container) ones yield a subset, go by name and can still
+# raise, e.g. for an unknown multiplexer value.
+DECODERS: Dict[int, Tuple[Callable, int, Optional[Tuple[int, ...]], Dict[str, int]]] = {}
+for _key, _m in FRAME_MAP.items():
+    _ids = tuple(range(len(SIG_INFO), len(SIG_INFO) + len(SIGNAL_META[_key])))
+    SIG_INFO.extend((_m.frame_id, _m.is_extended_frame, _m.name, name, unit)
+                    for name, unit in SIGNAL_META[_key])
+    _plain = not (_m.is_multiplexed() or getattr(_m, "is_container", False))
+    DECODERS[_key] = (_m.decode, _m.length,
+                      _ids if _plain else None,
+                      {name: sid for (name, _), sid in zip(SIGNAL_META[_key], _ids)})
+SIG_COUNT = len(SIG_INFO)
+
+class _FrameListener(can.Listener):
+    """Hands every frame from the Notifier thread to *callback*."""
+    def __init__(self, callback: Callable[[can.Message], None]):
         super().__init__()
+        self._callback = callback
+    def on_message_received(self, msg):
+        self._callback(msg)
+
+class CanReader:
+    """
+    Decodes frames into ``self.pending``; the GUI swaps it out on a timer.
+
+    pending maps sig_idx → (value, cycle, hits): a newer record overwrites the
+    older one for the same signal and only bumps hits, so the reader never
+    blocks and memory stays bounded by the number of DBC signals however far
+    the GUI falls behind. The table only ever shows the latest value anyway.
+
+    python-can's Notifier thread does the blocking wait on the bus and hands
+    each frame to _enqueue(), so there is no Python poll loop of our own.
+    """
+    def __init__(self, bus):       # <- receives ready-to-use bus
         self.bus = bus
-        self._running = True
-        self._last_ts: Dict[str, float] = {}
-    def run(self):
-        try:
-            while self._running:
-                msg = self.bus.recv(timeout=0.1)
-                if msg is None:
-                    continue
-                mdef = get_message(dbc, msg.arbitration_id, msg.is_extended_id)
-                if mdef is None:
-                    continue
-                try:
-                    decoded = mdef.decode(msg.data,
-                                          allow_truncated=False,
-                                          decode_choices=True)
-                except cantools.DecodeError:
-                    continue
-                now = msg.timestamp
-                for sig_name, val in decoded.items():
-                    qkey  = f"{mdef.name}.{sig_name}"
-                    cycle = round((now - self._last_ts.get(qkey, now)) * 1000, 1)
-                    self._last_ts[qkey] = now
-                    unit = mdef.get_signal_by_name(sig_name).unit or ""
-                    self.new_signal.emit(msg.arbitration_id,
-                                         msg.is_extended_id,
-                                         mdef.name, sig_name,
-                                         val, unit, cycle)
-        finally:
-            if hasattr(self.bus, "shutdown"):
-                self.bus.shutdown()
+        self.pending: Dict[int, Tuple[object, int, int]] = {}
+        self._lock = threading.Lock()               # guards pending swap/update
+        # sig_idx → last timestamp in integer µs, 0 = not seen yet
+        self._last_ts = array("q", [0]) * SIG_COUNT
+        self._notifier: Optional[can.Notifier] = None
+
+    def start(self):
+        if self._notifier is not None:
+            return
+        # the gap since pause() is no cycle time: start every signal afresh
+        self._last_ts = array("q", [0]) * SIG_COUNT
+        listener = _FrameListener(self._enqueue)
+        self._notifier = can.Notifier(self.bus, [listener], timeout=0.1)
+
+    def pause(self):
+        """Stop reading but keep the bus open for a later start()."""
+        if self._notifier is not None:
+            self._notifier.stop()           # joins the RX thread
+            self._notifier = None
+
+    def _enqueue(self, msg):
+        entry = DECODERS.get(msg.arbitration_id | (msg.is_extended_id << 31))
+        if entry is None:
+            return
+        decode, length, ordered, by_name = entry
+        data = msg.data
+        if len(data) < length:                      # truncated: cantools would raise
+            return
+        if ordered is not None:
+            pairs = zip(ordered, decode(data, decode_choices=True).values())
+        else:
+            try:
+                decoded = decode(data, allow_truncated=False, decode_choices=True)
+            except cantools.DecodeError:
+                return
+            pairs = ((by_name[n], v) for n, v in decoded.items())
+        last_ts = self._last_ts
+        now = int(msg.timestamp * 1_000_000)        # µs
+        with self._lock:                            # once per frame
+            pending = self.pending
+            for sig_idx, val in pairs:
+                last = last_ts[sig_idx]
+                # cycle in tenths of a ms, rounded half up: all integer math
+                cycle = (now - last + 50) // 100 if last else 0
+                last_ts[sig_idx] = now
+                prev = pending.get(sig_idx)
+                pending[sig_idx] = (val, cycle, prev[2] + 1 if prev else 1)
+
+    def take_pending(self) -> Dict[int, Tuple[object, int, int]]:
+        """Hand the accumulated records to the caller and start a new dict."""
+        with self._lock:
+            pending, self.pending = self.pending, {}
+        return pending
+
     def stop(self):
-        self._running = False
-        self.wait()
+        self.pause()
+        if hasattr(self.bus, "shutdown"):
+            self.bus.shutdown()
 
 class MainWindow(QMainWindow):
-    headers = ["Message ID", "Message Name", "Signal Name",
-               "Value", "Unit", "Cycle Time (ms)", "Count"]
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Live CAN Signal Viewer")
         self.resize(1150, 650)
 
-        self.table = QTableWidget(0, len(self.headers))
-        self.table.setHorizontalHeaderLabels(self.headers)
+        self.model = CanTableModel(SIG_INFO, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-
-        self.row_map:   Dict[str, int] = {}
-        self.count_map: Dict[str, int] = {}
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
 
         self.restart_button = QPushButton("Restart Count")
         self.restart_button.clicked.connect(self.restart_counts)
@@ -81,37 +145,33 @@ class MainWindow(QMainWindow):
         lay = QVBoxLayout(); lay.addWidget(self.table); lay.addWidget(self.restart_button)
         root = QWidget();   root.setLayout(lay); self.setCentralWidget(root)
 
+        # started in showEvent, paused while the home page keeps us hidden
         self.reader = CanReader(BUS)
-        self.reader.new_signal.connect(self.update_row)
-        self.reader.start()
+        self.drain_timer = QTimer(self)
+        self.drain_timer.timeout.connect(self.drain_pending)
+
+    def drain_pending(self):
+        latest = self.reader.take_pending()
+        if latest:
+            self.model.apply(latest)
 
     def restart_counts(self):
-        self.count_map.clear()
-        for row in range(self.table.rowCount()):
-            self.table.item(row, 6).setText("0")
-
-    def update_row(self, frame_id: int, is_ext: bool, msg_name: str, sig_name: str,
-                   value: float, unit: str, cycle_ms: float):
-        key  = f"{msg_name}.{sig_name}"
-        row  = self.row_map.get(key)
-        id_text  = f"0x{frame_id:X}" + (" (EXT)" if is_ext else "")
-        val_text = str(value)
-        cyc_text = f"{cycle_ms:.1f}" if cycle_ms else "—"
-        count    = self.count_map.get(key, 0) + 1
-        self.count_map[key] = count
-        if row is None:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            for col, text in enumerate([id_text, msg_name, sig_name,
-                                        val_text, unit, cyc_text, str(count)]):
-                self.table.setItem(row, col, QTableWidgetItem(text))
-            self.row_map[key] = row
-        else:
-            self.table.item(row, 0).setText(id_text)
-            self.table.item(row, 3).setText(val_text)
-            self.table.item(row, 5).setText(cyc_text)
-            self.table.item(row, 6).setText(str(count))
+        self.model.reset_counts()
+
+    def showEvent(self, event):
+        self.reader.start()
+        self.drain_timer.start(DRAIN_MS)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # a minimised window is still "live"; only an explicit hide pauses
+        if not event.spontaneous():
+            self.drain_timer.stop()
+            self.reader.pause()
+        super().hideEvent(event)
+
     def closeEvent(self, event):
+        self.drain_timer.stop()
         self.reader.stop()
         super().closeEvent(event)
 
@@ -9,18 +9,30 @@ Buttons:
 • Settings             → opens Settings.MainWindow
 
 Only one child window is visible at a time; when it closes, control
-returns to the home page.
+returns to the home page.  Child windows are built once and only hidden on
+close, so reopening them skips the full construction cost; the viewer and
+transmit windows pause their bus activity (RX notifier, TX scheduler) while
+hidden and resume it when shown again.  The DBC parse and the PCANBasic DLL
+load start in the background while Qt initialises.
 """
 
 from __future__ import annotations
 import sys
 import importlib
-from PySide6.QtCore import Qt
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import QEvent
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QPushButton
 )
-from shiboken6 import isValid
+
+
+@functools.cache
+def _resolve_class(module_name: str, attr: str):
+    """Import *module_name* (once) and return the attr (class) asked for."""
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return getattr(module, attr)
 
 
 class HomeWindow(QMainWindow):
@@ -57,60 +69,73 @@ class HomeWindow(QMainWindow):
         self._tx_window = None
         self._settings = None
         self._dbc_tools = None
-
-    # ── helpers ─────────────────────────────────────────────────────────────
-    def _load_window(self, module_name: str, attr: str):
-        """Dynamically import *module_name* and return the attr (class) asked for."""
-        module = importlib.import_module(module_name)
-        return getattr(module, attr)
+        self._closing = False
 
     def open_viewer(self):
-        if self._viewer is None or not isValid(self._viewer):
-            ViewerClass = self._load_window("live_signal_viewer", "MainWindow")
+        if self._viewer is None:
+            ViewerClass = _resolve_class("live_signal_viewer", "MainWindow")
             self._viewer = ViewerClass()
-            self._viewer.setAttribute(Qt.WA_DeleteOnClose, True)
-            self._viewer.destroyed.connect(self._child_closed)
+            self._viewer.installEventFilter(self)
         self._viewer.show(); self.hide()
 
     def open_transmit(self):
-        if self._tx_window is None or not isValid(self._tx_window):
-            TxClass = self._load_window("live_signal_transmit", "MainWindow")
+        if self._tx_window is None:
+            TxClass = _resolve_class("live_signal_transmit", "MainWindow")
             self._tx_window = TxClass()
-            self._tx_window.setAttribute(Qt.WA_DeleteOnClose, True)
-            self._tx_window.destroyed.connect(self._child_closed)
+            self._tx_window.installEventFilter(self)
         self._tx_window.show(); self.hide()
 
     def open_settings(self):
-        if self._settings is None or not isValid(self._settings):
-            SettingsClass = self._load_window("Settings", "MainWindow")
+        if self._settings is None:
+            SettingsClass = _resolve_class("Settings", "MainWindow")
             self._settings = SettingsClass()
-            self._settings.setAttribute(Qt.WA_DeleteOnClose, True)
-            self._settings.destroyed.connect(self._child_closed)
+            self._settings.installEventFilter(self)
         self._settings.show(); self.hide()
 
     def open_dbc_tools(self):
-        if self._dbc_tools is None or not isValid(self._dbc_tools):
-            DbcToolsClass = self._load_window("dbc_converter_tools", "MainWindow")
+        if self._dbc_tools is None:
+            DbcToolsClass = _resolve_class("dbc_converter_tools", "MainWindow")
             self._dbc_tools = DbcToolsClass()
-            self._dbc_tools.setAttribute(Qt.WA_DeleteOnClose, True)
-            self._dbc_tools.destroyed.connect(self._child_closed)
+            self._dbc_tools.installEventFilter(self)
         self._dbc_tools.show(); self.hide()
 
-    def _child_closed(self):
-        """Called when either child window is destroyed."""
-        s = self.sender()
-        if s is self._viewer:
-            self._viewer = None
-        elif s is self._tx_window:
-            self._tx_window = None
-        elif s is self._settings:
-            self._settings = None
-        elif s is self._dbc_tools:
-            self._dbc_tools = None
-        self.show()
+    def eventFilter(self, obj, event):
+        """Hide a child window on close instead of destroying it."""
+        if event.type() == QEvent.Close and not self._closing:
+            event.ignore()
+            obj.hide()
+            self.show()
+            return True
+        return super().eventFilter(obj, event)
+
+    def closeEvent(self, event):
+        # Really close the cached children so their own cleanup (e.g. stopping
+        # reader threads) runs before the application quits.
+        self._closing = True
+        for w in (self._viewer, self._tx_window, self._settings, self._dbc_tools):
+            if w is not None:
+                w.close()
+        super().closeEvent(event)
+
+
+def _call(module_name: str, func: str) -> None:
+    getattr(importlib.import_module(module_name), func)()
+
+
+def _warm_up() -> None:
+    """Parse the DBC and preload the PCAN DLL off the GUI thread.
+
+    Both results are cached in their modules, so the first viewer window
+    finds them ready; failures are left for that window to report.
+    """
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="warm-up")
+    pool.submit(_call, "dbc_decode_input", "get_dbc")
+    pool.submit(_call, "PEAK_API", "_preload_pcanbasic_dll")
+    pool.shutdown(wait=False)
 
 
 def main() -> None:
+    _warm_up()
     app = QApplication(sys.argv)
     home = HomeWindow(); home.show()
     sys.exit(app.exec())
@@ -31,27 +31,29 @@ def monitor(channel: str = "PCAN_USBBUS1", bitrate: int = 500000) -> None:
 
     bus = can.Bus(bustype="pcan", channel=channel, bitrate=bitrate)
     input("Press Enter to start the statistics")
+    # python-can's Notifier thread receives into the reader's queue; this
+    # loop only wakes once a second and drains whatever has arrived.
+    reader = can.BufferedReader()
+    notifier = can.Notifier(bus, [reader], timeout=1.0)
+    get_message = reader.get_message
     total = 0
-    count = 0
-    last_report = time.time()
+    last_report = time.monotonic()
 
     try:
         while True:
-            msg = bus.recv(timeout=1.0)
-            if msg is None:
-                continue
-
-            total += 1
-            count += 1
-            now = time.time()
-            if now - last_report >= 1.0:
-                frames_per_second = count / (now - last_report)
-                print(f"{frames_per_second:7.2f} frames/s  |  total: {total}")
-                last_report = now
-                count = 0
+            time.sleep(max(0.0, last_report + 1.0 - time.monotonic()))
+            count = 0
+            while get_message(0) is not None:
+                count += 1
+            total += count
+            now = time.monotonic()
+            frames_per_second = count / (now - last_report)
+            print(f"{frames_per_second:7.2f} frames/s  |  total: {total}")
+            last_report = now
     except KeyboardInterrupt:  # pragma: no cover - user interruption
         pass
     finally:
+        notifier.stop()
         bus.shutdown()
 
 
@@ -3,74 +3,196 @@
 from __future__ import annotations
 
 import ctypes
+import struct
 import sys
 import time
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
-from threading import Lock
-from typing import Dict
+from typing import Dict, Iterable, List, Set, Tuple
 
-from PySide6.QtCore import QTimer, Qt, QThread
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QTimer, Qt, QThread
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
     QHeaderView,
     QMainWindow,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
 
+# PassThruReadMsgs results that still report a valid message count
+STATUS_NOERROR = 0x00
+ERR_TIMEOUT = 0x09
+ERR_BUFFER_EMPTY = 0x10
+_READ_OK = frozenset((STATUS_NOERROR, ERR_TIMEOUT, ERR_BUFFER_EMPTY))
+
+# J2534 CAN messages carry the arbitration ID big-endian in Data[0:4]
+_ID_STRUCT = struct.Struct(">I")
+_id_unpack = _ID_STRUCT.unpack_from
+
+
 @dataclass
-class _StatEntry:
-    count: int = 0
-    last_time: float | None = None
-    cycle_time_ms: float = 0.0
+class _StatColumns:
+    """Per-ID stats stored column-wise: an ID's values sit at its slot."""
+    slot: Dict[int, int] = field(default_factory=dict)      # CAN ID → slot
+    counts: array = field(default_factory=lambda: array("Q"))
+    last_us: array = field(default_factory=lambda: array("Q"))   # same clock as the frame timestamps
+    cycle_ms: array = field(default_factory=lambda: array("d"))
+    # slots updated since the GUI last took the set (see StatsTableModel.refresh)
+    dirty: Set[int] = field(default_factory=set)
 
 
 class CANStats:
-    """Track count and cycle time for CAN identifiers."""
+    """Track count and cycle time for CAN identifiers.
+
+    A frame costs one dict lookup and three indexed stores into flat arrays
+    instead of attribute writes on a per-ID object.
+
+    Single writer, no lock: only the reader thread calls update_many(), and
+    the GUI side never mutates the columns. A new ID's slot is published
+    only after its array entries exist, so a reader that finds it in
+    ``slot`` can always index the arrays; reset() swaps in a fresh
+    _StatColumns rather than clearing the one the writer may be filling.
+    """
 
     def __init__(self) -> None:
-        self._stats: Dict[int, _StatEntry] = {}
-        self._lock = Lock()
-
-    def update(self, can_id: int) -> None:
-        now = time.time()
-        with self._lock:
-            entry = self._stats.get(can_id)
-            if entry is None:
-                entry = _StatEntry(count=1, last_time=now, cycle_time_ms=0.0)
-                self._stats[can_id] = entry
-            else:
-                if entry.last_time is not None:
-                    entry.cycle_time_ms = (now - entry.last_time) * 1000.0
-                entry.last_time = now
-                entry.count += 1
+        self._cols = _StatColumns()
+
+    def update(self, can_id: int, timestamp_us: int | None = None) -> None:
+        """Count a frame of *can_id* received at *timestamp_us* (default: now)."""
+        if timestamp_us is None:
+            timestamp_us = time.perf_counter_ns() // 1000
+        self.update_many(((can_id, timestamp_us),))
+
+    def update_many(self, items: Iterable[Tuple[int, int]]) -> None:
+        """Count a batch of (can_id, timestamp in µs) frames. Reader thread only.
+
+        The J2534 Timestamp field is a 32-bit µs counter, so differences are
+        taken modulo 2**32 to survive its wrap-around (every ~71 minutes).
+        """
+        cols = self._cols
+        slot_of, counts, last_us, cycle_ms = cols.slot, cols.counts, cols.last_us, cols.cycle_ms
+        mark = cols.dirty.add
+        for can_id, now in items:
+            i = slot_of.get(can_id)
+            if i is None:
+                counts.append(1)
+                last_us.append(now)
+                cycle_ms.append(0.0)
+                slot_of[can_id] = len(counts) - 1
+                continue
+            cycle_ms[i] = ((now - last_us[i]) & 0xFFFFFFFF) / 1000.0
+            last_us[i] = now
+            counts[i] += 1
+            mark(i)
 
     def snapshot(self) -> Dict[int, Dict[str, float | int]]:
-        with self._lock:
-            return {
-                can_id: {
-                    "count": entry.count,
-                    "cycle_time_ms": entry.cycle_time_ms,
-                }
-                for can_id, entry in self._stats.items()
+        cols = self._cols
+        counts, cycle_ms = cols.counts, cols.cycle_ms
+        # list() of the items view runs without releasing the GIL, so the
+        # writer cannot insert mid-copy
+        return {
+            can_id: {
+                "count": counts[i],
+                "cycle_time_ms": cycle_ms[i],
             }
+            for can_id, i in list(cols.slot.items())
+        }
+
+    def columns(self) -> _StatColumns:
+        """The live columns, for readers that index them directly."""
+        return self._cols
 
     def reset(self) -> None:
-        with self._lock:
-            self._stats.clear()
+        # the writer picks the new columns up with its next batch
+        self._cols = _StatColumns()
+
+
+class StatsTableModel(QAbstractTableModel):
+    """Rows of (CAN ID, cycle time, count) read straight from CANStats' columns.
+
+    The model keeps only the sorted (can_id, slot) row list; cell text is
+    formatted in data() for the cells the view actually paints, and each
+    refresh signals only the rows whose ID was received since the last one.
+    """
+
+    headers = ["CAN ID", "Cycle Time (ms)", "Count"]
+
+    def __init__(self, stats: CANStats, parent=None) -> None:
+        super().__init__(parent)
+        self._stats = stats
+        self._cols = stats.columns()
+        self._rows: List[Tuple[int, int]] = []      # (can_id, slot), by CAN ID
+        self._row_of_slot: Dict[int, int] = {}
+        self._hex_cache: Dict[int, str] = {}         # CAN ID → ID column text
+        self._taken: Set[int] = set()                # dirty set taken last refresh
+
+    # ---- Qt model interface ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        if role != Qt.DisplayRole:
+            return None
+        can_id, i = self._rows[index.row()]
+        col = index.column()
+        if col == 0:
+            text = self._hex_cache.get(can_id)
+            if text is None:
+                text = self._hex_cache[can_id] = f"{can_id:08X}"
+            return text
+        if col == 1:
+            return f"{self._cols.cycle_ms[i]:.2f}"
+        return str(self._cols.counts[i])
+
+    # ---- refresh from the GUI timer ----
+    def refresh(self) -> None:
+        cols = self._stats.columns()
+        # Take the writer's dirty set by swapping in an empty one. A batch
+        # that was in flight may still add to the set taken here, so it is
+        # read again (now settled) on the next refresh. list() copies a set
+        # without releasing the GIL.
+        taken, cols.dirty = cols.dirty, set()
+        dirty = set(list(taken))
+        dirty.update(list(self._taken))
+        self._taken = taken
+        if cols is not self._cols or len(cols.slot) != len(self._rows):
+            # new IDs (or a reset): re-sort once; otherwise the order holds
+            self.beginResetModel()
+            self._cols = cols
+            self._rows = sorted(list(cols.slot.items()))
+            self._row_of_slot = {i: row for row, (_, i) in enumerate(self._rows)}
+            self.endResetModel()
+            return
+        row_of_slot = self._row_of_slot
+        for i in dirty:
+            row = row_of_slot.get(i)
+            if row is not None:
+                self.dataChanged.emit(self.index(row, 1), self.index(row, 2),
+                                      [Qt.DisplayRole])
 
 
 class CANFrame:
     def __init__(self) -> None:
         self.CAN_ID = 0
         self.DLC = 0
-        self.data: list[int] = []
+        self.data: bytes = b""
 
     def __repr__(self) -> str:
         return f"CANFrame(CAN_ID={self.CAN_ID}, DLC={self.DLC}, data={self.data})"
@@ -198,18 +320,33 @@ class J2534API:
             self.channel_id, ctypes.byref(Rx_Msg), ctypes.byref(num_msgs), timeout
         )
 
-        response = bytearray(Rx_Msg.Data)
         frame = CANFrame()
-        frame.CAN_ID = (
-            (response[0] << 24)
-            | (response[1] << 16)
-            | (response[2] << 8)
-            | response[3]
-        )
-        frame.DLC = Rx_Msg.DataSize - 4
-        frame.data = [response[4 + i] for i in range(frame.DLC)]
+        if status != STATUS_NOERROR or num_msgs.value < 1:
+            return status, frame
+        # copy just the used part of Data in one memcpy, never past the buffer
+        size = min(Rx_Msg.DataSize, len(Rx_Msg.Data))
+        raw = ctypes.string_at(ctypes.addressof(Rx_Msg.Data), size)
+        if len(raw) >= 4:
+            frame.CAN_ID = _id_unpack(raw, 0)[0] & 0x1FFFFFFF
+            frame.data = raw[4:]
+            frame.DLC = len(frame.data)
         return status, frame
 
+    def SBusCanReadMgsBatch(self, buf, n_ref, timeout=0):
+        """Read up to ``n_ref.value`` messages into the preallocated *buf*.
+
+        One DLL call for the whole batch. On STATUS_NOERROR, ERR_TIMEOUT (a
+        partial batch) or ERR_BUFFER_EMPTY, ``n_ref.value`` holds the number
+        of messages read; on any other status it is set to 0, since the
+        driver may not have written it. Returns the status.
+        """
+        status = self.j2534_dll.PassThruReadMsgs(
+            self.channel_id, buf, ctypes.byref(n_ref), timeout
+        )
+        if status not in _READ_OK:
+            n_ref.value = 0
+        return status
+
     def SBusCanDisconnect(self):
         return self.j2534_dll.PassThruDisconnect(self.channel_id)
 
@@ -217,6 +354,11 @@ class J2534API:
         return self.j2534_dll.PassThruClose(self.device_id)
 
 
+# Messages fetched per PassThruReadMsgs call by the reader thread
+RX_BATCH = 64
+MsgArrayN = J2534API.SMsg * RX_BATCH
+
+
 class CANReaderThread(QThread):
     def __init__(self, stats: CANStats, japi: J2534API, parent=None) -> None:
         super().__init__(parent)
@@ -230,10 +372,26 @@ class CANReaderThread(QThread):
         if self._japi.SBusCanConnect(J2534API.Protocol_ID.CAN.value, 500000) != 0:
             return
         self._japi.SBusCanClearRxMsg()
+        # one receive buffer and count for the thread's lifetime
+        buf = MsgArrayN()
+        n = ctypes.c_ulong()
+        read_batch = self._japi.SBusCanReadMgsBatch
+        update_many = self._stats.update_many
         while self._running:
-            status, frame = self._japi.SBusCanReadMgs(10)
-            if status == 0:
-                self._stats.update(frame.CAN_ID)
+            n.value = RX_BATCH
+            status = read_batch(buf, n, 10)
+            if status not in _READ_OK:
+                self.msleep(10)         # driver error: don't spin on it
+                continue
+            if not n.value:
+                continue
+            # cycle times come from the adapter's own receive timestamps:
+            # no clock read per frame, and no skew from batching
+            frames = []
+            for i in range(n.value):
+                m = buf[i]
+                frames.append((_id_unpack(m.Data)[0] & 0x1FFFFFFF, m.Timestamp))
+            update_many(frames)
 
     def stop(self) -> None:
         self._running = False
@@ -252,8 +410,9 @@ class StatsWindow(QMainWindow):
         central_widget = QWidget()
         layout = QVBoxLayout()
 
-        self._table = QTableWidget(0, 3)
-        self._table.setHorizontalHeaderLabels(["CAN ID", "Cycle Time (ms)", "Count"])
+        self._model = StatsTableModel(self._stats, self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self._table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
@@ -273,23 +432,11 @@ class StatsWindow(QMainWindow):
         self._reader.start()
 
     def _refresh(self) -> None:
-        data = self._stats.snapshot()
-        self._table.setRowCount(len(data))
-        for row, (can_id, info) in enumerate(sorted(data.items())):
-            can_item = QTableWidgetItem(f"{can_id:08X}")
-            cycle_item = QTableWidgetItem(f"{info['cycle_time_ms']:.2f}")
-            count_item = QTableWidgetItem(str(info["count"]))
-            can_item.setTextAlignment(Qt.AlignCenter)
-            cycle_item.setTextAlignment(Qt.AlignCenter)
-            count_item.setTextAlignment(Qt.AlignCenter)
-            self._table.setItem(row, 0, can_item)
-            self._table.setItem(row, 1, cycle_item)
-            self._table.setItem(row, 2, count_item)
+        self._model.refresh()
 
     def _restart_stats(self) -> None:
         self._stats.reset()
-        self._table.clearContents()
-        self._table.setRowCount(0)
+        self._model.refresh()
 
     def closeEvent(self, event) -> None:
         self._timer.stop()